@@ -1,57 +1,179 @@
 """
-Persistent cache for selectors - saves to disk as JSON.
+Persistent cache for selectors - JSON snapshot plus a write-ahead log.
 """
+import atexit
+import io
 import json
+import os
+import threading
 from pathlib import Path
 from typing import Optional, Dict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 CACHE_FILE = Path("data/cache/selectors.json")
+WAL_FILE = Path("data/cache/selectors.wal")
+
+
+def _loads(data: bytes):
+    """Deserialize cache bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to compact JSON bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
 
 
 class SelectorCache:
     """
     Persistent cache for XPath selectors from observe().
     Saves to disk so selectors survive across runs.
+
+    Loading is lazy: the cache file is only read on the first get/set,
+    so importing this module does no disk I/O. Mutations append one
+    NDJSON line to a write-ahead log (selectors.wal) instead of
+    rewriting the whole snapshot, so set() stays O(1) as the cache
+    grows. Startup replays the snapshot then the WAL tail; compact()
+    folds the WAL back into the snapshot atomically.
     """
 
     def __init__(self):
         self._cache: Dict[str, str] = {}
-        self._load()
+        self._loaded = False
+        self._wal = None
+        self._lock = threading.Lock()
+        atexit.register(self._close)
+
+    def _ensure_loaded(self):
+        """Load the cache from disk on first access."""
+        if not self._loaded:
+            self._loaded = True
+            self._load()
 
     def _load(self):
-        """Load cache from disk."""
+        """Load the snapshot from disk, then replay any WAL tail."""
         if CACHE_FILE.exists():
             try:
-                self._cache = json.loads(CACHE_FILE.read_text())
+                self._cache = _loads(CACHE_FILE.read_bytes())
                 print(f"[Cache] Loaded {len(self._cache)} cached selectors")
-            except (json.JSONDecodeError, IOError):
+            except (ValueError, IOError):
                 self._cache = {}
+        self._replay_wal()
+
+    def _replay_wal(self):
+        """Apply WAL entries written after the last compaction."""
+        if not WAL_FILE.exists():
+            return
+        replayed = 0
+        try:
+            with open(WAL_FILE, "rb") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = _loads(line)
+                    except ValueError:
+                        # Torn write at the tail (e.g. crash mid-append)
+                        continue
+                    op = entry.get("op")
+                    if op == "set":
+                        self._cache[entry["k"]] = entry["v"]
+                    elif op == "del":
+                        self._cache.pop(entry["k"], None)
+                    elif op == "clear":
+                        self._cache.clear()
+                    replayed += 1
+        except IOError:
+            return
+        if replayed:
+            print(f"[Cache] Replayed {replayed} WAL entries")
+
+    def _wal_handle(self):
+        """Open the buffered append-only WAL handle on first mutation."""
+        if self._wal is None:
+            WAL_FILE.parent.mkdir(parents=True, exist_ok=True)
+            self._wal = open(WAL_FILE, "ab", buffering=io.DEFAULT_BUFFER_SIZE)
+        return self._wal
+
+    def _append(self, entry: dict):
+        """Append one mutation record to the WAL (buffered)."""
+        self._wal_handle().write(_dumps(entry) + b"\n")
 
     def _save(self):
-        """Save cache to disk."""
+        """Write the snapshot to disk atomically (tempfile + rename)."""
         CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        CACHE_FILE.write_text(json.dumps(self._cache, indent=2))
+        tmp_file = CACHE_FILE.with_suffix(CACHE_FILE.suffix + ".tmp")
+        tmp_file.write_bytes(_dumps(self._cache))
+        os.replace(tmp_file, CACHE_FILE)
+
+    def _close(self):
+        """Flush and close the WAL (called at interpreter exit)."""
+        with self._lock:
+            if self._wal is not None:
+                try:
+                    self._wal.flush()
+                    self._wal.close()
+                except IOError:
+                    pass
+                self._wal = None
+
+    def flush(self) -> None:
+        """Force buffered WAL appends to durable storage."""
+        with self._lock:
+            if self._wal is not None:
+                self._wal.flush()
+                os.fsync(self._wal.fileno())
+
+    def compact(self) -> None:
+        """Fold the WAL into the JSON snapshot and truncate it."""
+        with self._lock:
+            self._ensure_loaded()
+            self._save()
+            if self._wal is not None:
+                try:
+                    self._wal.close()
+                except IOError:
+                    pass
+                self._wal = None
+            if WAL_FILE.exists():
+                WAL_FILE.unlink()
 
     def get(self, key: str) -> Optional[str]:
         """Get cached selector or None if not found."""
+        self._ensure_loaded()
         return self._cache.get(key)
 
     def set(self, key: str, selector: str) -> None:
-        """Cache a selector and persist to disk."""
-        self._cache[key] = selector
-        self._save()
+        """Cache a selector; persisted as one WAL append."""
+        with self._lock:
+            self._ensure_loaded()
+            self._cache[key] = selector
+            self._append({"op": "set", "k": key, "v": selector})
         print(f"[Cache] Saved selector for '{key}'")
 
     def delete(self, key: str) -> None:
         """Remove a selector from cache."""
-        if key in self._cache:
-            del self._cache[key]
-            self._save()
+        with self._lock:
+            self._ensure_loaded()
+            if key in self._cache:
+                del self._cache[key]
+                self._append({"op": "del", "k": key})
 
     def clear(self) -> None:
         """Clear all cached selectors."""
-        self._cache.clear()
-        self._save()
+        with self._lock:
+            self._loaded = True
+            self._cache.clear()
+            self._append({"op": "clear"})
 
 
 # Global singleton instance
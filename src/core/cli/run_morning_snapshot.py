@@ -1,19 +1,51 @@
 # src/core/cli/run_morning_snapshot.py
 
+import array
 import asyncio
+import atexit
 import json
+import logging
 import os
+import queue
+import sys
 import time
-from datetime import date
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 load_dotenv()
 
+# uvloop speeds up asyncio task scheduling and socket I/O considerably for
+# this kind of many-concurrent-sessions workload; fall back silently to the
+# stdlib event loop when it isn't installed (e.g. Windows).
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
+from typing import List, Optional
+
+from pydantic import BaseModel
+
 from src.core.stagehand_runner import create_stagehand_session
-from src.core.report_builder import build_morning_report
+from src.core.report_builder import TickerBundle, build_morning_report
 from src.core.observability.errors import get_error_tracker
+from src.core.observability.guardrails import (
+    GuardrailTimer,
+    check_session_creation,
+    is_guardrails_enabled,
+)
 from src.skills.yahoo.quote import YahooQuoteSnapshot, fetch_yahoo_quote
 from src.skills.yahoo.research import YahooAIAnalysis, fetch_yahoo_ai_analysis
 from src.skills.marketwatch.research import (
@@ -39,6 +71,21 @@ SNAPSHOT_DIR = Path("data/snapshots")
 REPORTS_DIR = Path("data/reports")
 METRICS_DIR = Path("data/metrics")
 
+# Hot-loop logging: process_ticker runs many coroutines that each emit a
+# handful of progress lines. print() grabs the stdout lock per call, so the
+# per-ticker path logs through a QueueHandler (non-blocking put) drained by a
+# single background QueueListener that owns the real stream writes. One-shot
+# messages (startup, "written to" lines) stay on print.
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+log = logging.getLogger("snapshot")
+log.setLevel(logging.INFO)
+log.addHandler(QueueHandler(_log_queue))
+log.propagate = False
+
 # Collect metrics during run - will be written to baseline at end
 run_metrics = {
     "pipeline_start_time": None,  # Set at start of main()
@@ -53,7 +100,18 @@ run_metrics = {
     },
     "browserbase": {
         "total_proxy_bytes": 0,
-        "sessions_detail": [],  # Individual session metrics
+        # Individual session metrics, stored as parallel columns (one append
+        # per field) instead of one dict per session; zipped back into
+        # records only when the metrics file is written.
+        "sessions_detail": {
+            "session_id": [],
+            "source": [],
+            "ticker": [],
+            "proxy_bytes": array.array("q"),
+            "avg_cpu_usage": [],
+            "memory_usage": [],
+            "status": [],
+        },
     },
     "quality": {
         "per_ticker": {},  # {ticker: {googlenews_articles, googlenews_bullets, yahoo_ai_bullets, vital_knowledge_headlines}}
@@ -61,26 +119,180 @@ run_metrics = {
 }
 
 
+def _json_default(obj):
+    """Dump pydantic models lazily so serialization happens only at the write boundary."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize machine-read payloads to compact JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default)
+    return json.dumps(obj, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+
+def _json_loads(data: bytes):
+    """Deserialize JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _atomic_write_bytes(path: Path, data: bytes):
+    """Write `data` to `path` atomically (tmp file + fsync + os.replace).
+
+    Readers either see the previous complete file or the new complete file;
+    a crash mid-write can never leave a truncated snapshot behind. The
+    payload goes out as one unbuffered write() call.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb", buffering=0) as f:
+        f.write(data)
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+# Typed snapshot envelopes: serializing these with model_dump_json() runs one
+# pydantic-core (Rust) pass per file instead of model_dump() dicts fed to the
+# pure-Python json encoder.
+class _YahooEntry(BaseModel):
+    ticker: Optional[str] = None
+    error: Optional[str] = None
+    quote: Optional[YahooQuoteSnapshot] = None
+    analysis: Optional[YahooAIAnalysis] = None
+
+
+class _MarketWatchEntry(BaseModel):
+    ticker: Optional[str] = None
+    error: Optional[str] = None
+    marketwatch: Optional[MarketWatchTopStories] = None
+
+
+class _GoogleNewsEntry(BaseModel):
+    ticker: Optional[str] = None
+    error: Optional[str] = None
+    googlenews: Optional[GoogleNewsTopStories] = None
+
+
+class _VitalKnowledgeEntry(BaseModel):
+    ticker: Optional[str] = None
+    error: Optional[str] = None
+    vital_knowledge: Optional[VitalKnowledgeReport] = None
+
+
+class _YahooSnapshot(BaseModel):
+    as_of: str
+    tickers: List[_YahooEntry]
+
+
+class _MarketWatchSnapshot(BaseModel):
+    as_of: str
+    tickers: List[_MarketWatchEntry]
+
+
+class _GoogleNewsSnapshot(BaseModel):
+    as_of: str
+    tickers: List[_GoogleNewsEntry]
+
+
+class _VitalKnowledgeSnapshot(BaseModel):
+    as_of: str
+    tickers: List[_VitalKnowledgeEntry]
+
+
+class _MacroNewsSnapshot(BaseModel):
+    as_of: str
+    macro_news: Optional[MacroNewsSummary] = None
+
+
+# Shared zero result for metric collection failures; callers only read from it.
+_ZERO_LLM_METRICS = {"prompt_tokens": 0, "completion_tokens": 0, "inference_time_ms": 0}
+
+
 def collect_stagehand_metrics(stagehand):
     """Extract LLM token metrics from stagehand.metrics (StagehandMetrics dataclass)."""
     try:
         metrics = stagehand.metrics
+        # Direct attribute access: StagehandMetrics always defines these
+        # fields, so the defaulted getattr chain was paying for a case that
+        # the except below already covers.
         return {
-            "prompt_tokens": getattr(metrics, 'total_prompt_tokens', 0) or 0,
-            "completion_tokens": getattr(metrics, 'total_completion_tokens', 0) or 0,
-            "inference_time_ms": getattr(metrics, 'total_inference_time_ms', 0) or 0,
+            "prompt_tokens": metrics.total_prompt_tokens or 0,
+            "completion_tokens": metrics.total_completion_tokens or 0,
+            "inference_time_ms": metrics.total_inference_time_ms or 0,
         }
     except Exception as e:
         print(f"[Metrics] Warning: Could not collect stagehand metrics: {e}")
-        return {"prompt_tokens": 0, "completion_tokens": 0, "inference_time_ms": 0}
+        return _ZERO_LLM_METRICS
+
+
+# Shared Browserbase API client, created lazily on first metrics fetch so the
+# import/connection setup isn't paid once per session lookup.
+_BB_CLIENT = None
+
+# Bounded executor for the blocking SDK retrieves: the end-of-run metrics
+# fan-out would otherwise grow the default to_thread pool one OS thread per
+# session. Workers are spawned on demand, so an unused pool costs nothing.
+_BB_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="bb-metrics")
+atexit.register(_BB_POOL.shutdown)
+
+
+def _get_browserbase_client():
+    global _BB_CLIENT
+    if _BB_CLIENT is None:
+        from browserbase import Browserbase
+        _BB_CLIENT = Browserbase(api_key=os.getenv("BROWSERBASE_API_KEY"))
+    return _BB_CLIENT
+
+
+def _record_session_detail(session_id: str, source: str, ticker: str, bb_metrics: dict):
+    """Append one session's Browserbase metrics to the columnar detail store."""
+    detail = run_metrics["browserbase"]["sessions_detail"]
+    detail["session_id"].append(session_id)
+    detail["source"].append(source)
+    detail["ticker"].append(ticker)
+    detail["proxy_bytes"].append(bb_metrics["proxy_bytes"] or 0)
+    detail["avg_cpu_usage"].append(bb_metrics["avg_cpu_usage"])
+    detail["memory_usage"].append(bb_metrics["memory_usage"])
+    detail["status"].append(bb_metrics["status"])
+
+
+def _sessions_detail_records() -> list:
+    """Zip the columnar session details back into per-session dicts."""
+    detail = run_metrics["browserbase"]["sessions_detail"]
+    return [
+        {
+            "session_id": session_id,
+            "source": source,
+            "ticker": ticker,
+            "proxy_bytes": proxy_bytes,
+            "avg_cpu_usage": avg_cpu_usage,
+            "memory_usage": memory_usage,
+            "status": status,
+        }
+        for session_id, source, ticker, proxy_bytes, avg_cpu_usage, memory_usage, status in zip(
+            detail["session_id"],
+            detail["source"],
+            detail["ticker"],
+            detail["proxy_bytes"],
+            detail["avg_cpu_usage"],
+            detail["memory_usage"],
+            detail["status"],
+        )
+    ]
 
 
 async def collect_browserbase_metrics(session_id: str):
     """Fetch session metrics from Browserbase API."""
     try:
-        from browserbase import Browserbase
-        bb = Browserbase(api_key=os.getenv("BROWSERBASE_API_KEY"))
-        session = bb.sessions.retrieve(session_id)
+        bb = _get_browserbase_client()
+        # sessions.retrieve is a blocking HTTP call; keep it off the event loop
+        # and inside the bounded metrics pool.
+        session = await asyncio.get_running_loop().run_in_executor(
+            _BB_POOL, bb.sessions.retrieve, session_id
+        )
         return {
             "proxy_bytes": getattr(session, 'proxy_bytes', 0) or 0,
             "avg_cpu_usage": getattr(session, 'avg_cpu_usage', None),
@@ -94,8 +306,6 @@ async def collect_browserbase_metrics(session_id: str):
 
 def save_baseline_metrics(step: int = 0, name: str = "baseline"):
     """Save collected metrics to a numbered JSON file (e.g., 000_baseline.json, 001_phase1.json)."""
-    from datetime import datetime
-
     METRICS_DIR.mkdir(parents=True, exist_ok=True)
     filename = f"{step:03d}_{name}.json"
     metrics_path = METRICS_DIR / filename
@@ -125,14 +335,19 @@ def save_baseline_metrics(step: int = 0, name: str = "baseline"):
             "llm_tokens": run_metrics["llm_tokens"],
             "browserbase": {
                 "total_proxy_bytes": run_metrics["browserbase"]["total_proxy_bytes"],
-                "sessions_detail": run_metrics["browserbase"]["sessions_detail"],
+                "sessions_detail": _sessions_detail_records(),
             },
             "quality": run_metrics["quality"],
             "sessions": run_metrics["sessions"],
         },
     }
 
-    metrics_path.write_text(json.dumps(baseline, indent=2))
+    # Keep the indentation (this file is inspected by hand), but let orjson
+    # do the encoding when it's available.
+    if orjson is not None:
+        metrics_path.write_bytes(orjson.dumps(baseline, option=orjson.OPT_INDENT_2))
+    else:
+        metrics_path.write_text(json.dumps(baseline, indent=2))
 
     # Save human-readable .txt summary
     txt_path = METRICS_DIR / f"{step:03d}_{name}.txt"
@@ -244,189 +459,163 @@ def _get_max_concurrent_browsers() -> int:
         return 2
 
 
-async def _run_source_with_session(
+def _get_vital_days_back() -> int:
+    raw = os.getenv("Vital_Days_Back")
+    if not raw:
+        return 2
+    try:
+        return int(raw)
+    except ValueError:
+        return 2
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotConfig:
+    """Pipeline configuration resolved once at startup instead of per call site."""
+    use_yahoo_quote: bool = True
+    use_yahoo_analysis: bool = True
+    use_marketwatch: bool = True
+    use_googlenews: bool = True
+    use_vital_knowledge: bool = True
+    use_macro_news: bool = True
+    max_concurrent_browsers: int = 2
+    vital_days_back: int = 2
+
+
+def load_snapshot_config() -> SnapshotConfig:
+    """Parse the env-driven source flags and browser limit once."""
+    return SnapshotConfig(
+        use_yahoo_quote=_env_flag("ENABLE_YAHOO_QUOTE", True),
+        use_yahoo_analysis=_env_flag("ENABLE_YAHOO_ANALYSIS", True),
+        use_marketwatch=_env_flag("ENABLE_MARKETWATCH", True),
+        use_googlenews=_env_flag("ENABLE_GOOGLE_NEWS", True),
+        use_vital_knowledge=_env_flag("ENABLE_VITAL_NEWS", True),
+        use_macro_news=_env_flag("ENABLE_MACRO_NEWS", True),
+        max_concurrent_browsers=_get_max_concurrent_browsers(),
+        vital_days_back=_get_vital_days_back(),
+    )
+
+
+def _article_metadata(source_name: str, result):
+    """Build per-article metrics based on source type (None if not applicable)."""
+    if source_name == "GoogleNews" and result:
+        return {
+            "type": "articles",
+            "count": len(result.stories) if result.stories else 0,
+            "articles": [
+                {
+                    "headline": s.headline,
+                    "url": s.url,
+                    "source": s.source,
+                    "sentiment": s.sentiment,
+                    "has_summary": bool(s.summary and not s.summary.startswith("Error")),
+                }
+                for s in (result.stories or [])
+            ]
+        }
+    elif source_name == "YahooAI" and result:
+        return {
+            "type": "ai_analysis",
+            "bullet_count": len(result.bullets) if result.bullets else 0,
+        }
+    elif source_name == "MarketWatch" and result:
+        return {
+            "type": "stories",
+            "count": len(result.stories) if result.stories else 0,
+        }
+    return None
+
+
+async def _fetch_source_on_page(
     source_name: str,
     ticker: str,
     fetch_func,
-    sem: asyncio.Semaphore,
+    page,
+    session_id: str,
     *args,
     **kwargs,
 ):
-    """Run a source function with its own isolated browser session."""
-    stagehand = None
-    all_diagnostics = {}
-    failure_point = None
-    start_time = time.time()
+    """Run a source function on a shared per-ticker page, recording metrics and errors.
 
+    The browser session is owned by the caller (process_ticker), so source
+    failures are contained here while the session stays alive for the rest
+    of the ticker's sources.
+    """
+    start_time = time.time()
     try:
-        async with sem:  # Acquire semaphore slot for this session
-            from src.core.stagehand_runner import create_stagehand_session
-            from src.core.observability.guardrails import (
-                check_session_creation,
-                GuardrailTimer,
-                is_guardrails_enabled,
-            )
+        # Execute fetch function (which has its own guardrails)
+        result = await fetch_func(page, ticker, *args, **kwargs)
 
-            # GUARDRAIL: Session Creation
-            try:
-                with GuardrailTimer("session_creation") as session_timer:
-                    stagehand, page = await create_stagehand_session(
-                        source=source_name,
-                        ticker=ticker,
-                    )
-                all_diagnostics.update(session_timer.get_diagnostics())
-
-                if is_guardrails_enabled():
-                    session_diagnostics = await check_session_creation(stagehand, page)
-                    all_diagnostics.update(session_diagnostics)
-
-                    if not session_diagnostics.get("session_created", False):
-                        failure_point = "session_creation"
-                        raise Exception("Session creation failed")
-
-            except Exception as e:
-                failure_point = failure_point or "session_creation"
-                e.diagnostics = all_diagnostics
-                e.failure_point = failure_point
-                raise
-
-            # Execute fetch function (which has its own guardrails)
-            result = await fetch_func(page, ticker, *args, **kwargs)
-
-            # Collect enhanced metrics
-            duration = time.time() - start_time
-            session_id = getattr(stagehand, 'session_id', 'unknown')
-
-            # Collect LLM token metrics from stagehand
-            llm_metrics = collect_stagehand_metrics(stagehand)
-            run_metrics["llm_tokens"]["total_prompt_tokens"] += llm_metrics["prompt_tokens"]
-            run_metrics["llm_tokens"]["total_completion_tokens"] += llm_metrics["completion_tokens"]
-            run_metrics["llm_tokens"]["total_inference_time_ms"] += llm_metrics["inference_time_ms"]
-
-            # Collect Browserbase session metrics
-            bb_metrics = await collect_browserbase_metrics(session_id)
-            run_metrics["browserbase"]["total_proxy_bytes"] += bb_metrics["proxy_bytes"]
-            run_metrics["browserbase"]["sessions_detail"].append({
-                "session_id": session_id,
-                "source": source_name,
-                "ticker": ticker,
-                **bb_metrics,
-            })
-
-            print(f"[Metrics] {source_name}/{ticker}: {duration:.1f}s, tokens={llm_metrics['prompt_tokens']}+{llm_metrics['completion_tokens']}, session={session_id}")
-
-            if source_name not in run_metrics["timing"]["per_source"]:
-                run_metrics["timing"]["per_source"][source_name] = {}
-
-            # Build per-article metrics based on source type
-            article_metadata = None
-            if source_name == "GoogleNews" and result:
-                article_metadata = {
-                    "type": "articles",
-                    "count": len(result.stories) if result.stories else 0,
-                    "articles": [
-                        {
-                            "headline": s.headline,
-                            "url": s.url,
-                            "source": s.source,
-                            "sentiment": s.sentiment,
-                            "has_summary": bool(s.summary and not s.summary.startswith("Error")),
-                        }
-                        for s in (result.stories or [])
-                    ]
-                }
-            elif source_name == "YahooAI" and result:
-                article_metadata = {
-                    "type": "ai_analysis",
-                    "bullet_count": len(result.bullets) if result.bullets else 0,
-                }
-            elif source_name == "MarketWatch" and result:
-                article_metadata = {
-                    "type": "stories",
-                    "count": len(result.stories) if result.stories else 0,
-                }
+        duration = time.time() - start_time
+        log.info(f"[Metrics] {source_name}/{ticker}: {duration:.1f}s, session={session_id}")
 
-            run_metrics["timing"]["per_source"][source_name][ticker] = {
-                "duration_sec": round(duration, 1),
-                "session_id": session_id,
-                "llm_tokens": llm_metrics,
-            }
+        if source_name not in run_metrics["timing"]["per_source"]:
+            run_metrics["timing"]["per_source"][source_name] = {}
 
-            # Add article metadata if available
-            if article_metadata:
-                run_metrics["timing"]["per_source"][source_name][ticker]["articles"] = article_metadata
+        run_metrics["timing"]["per_source"][source_name][ticker] = {
+            "duration_sec": round(duration, 1),
+            "session_id": session_id,
+        }
 
-            run_metrics["sessions"].append(session_id)
-            run_metrics["success_count"] += 1
+        # Add article metadata if available
+        article_metadata = _article_metadata(source_name, result)
+        if article_metadata:
+            run_metrics["timing"]["per_source"][source_name][ticker]["articles"] = article_metadata
 
-            return result
+        run_metrics["success_count"] += 1
+        return result
 
     except Exception as e:
-        print(f"[ERROR] {ticker} {source_name} failed: {e}")
+        log.info(f"[ERROR] {ticker} {source_name} failed: {e}")
         # Track error with component identification
         error_tracker = get_error_tracker()
-
-        # Extract diagnostics and failure_point from exception if available (from guardrails)
-        # Merge with any session-level diagnostics
-        exception_diagnostics = getattr(e, 'diagnostics', {})
-        if exception_diagnostics:
-            all_diagnostics.update(exception_diagnostics)
-
-        diagnostics = all_diagnostics if all_diagnostics else None
-        failure_point = getattr(e, 'failure_point', failure_point)
-
-        # Get session_id for debugging via Browserbase Session Inspector
-        session_id = getattr(stagehand, 'session_id', None) if stagehand else None
-
         error_tracker.record_error(
             error=e,
             component=f"{source_name} ({fetch_func.__module__})",  # e.g., "YahooQuote (src.skills.yahoo.quote)"
             context={"ticker": ticker, "source": source_name, "function": fetch_func.__name__},
-            diagnostics=diagnostics,
-            failure_point=failure_point,
+            diagnostics=getattr(e, 'diagnostics', None),
+            failure_point=getattr(e, 'failure_point', None),
             session_id=session_id,
         )
         run_metrics["error_count"] += 1
         return None
-    finally:
-        if stagehand is not None:
-            try:
-                await stagehand.close()
-            except Exception as close_error:
-                print(f"[WARN] Error closing {source_name} session for {ticker}: {close_error}")
 
 
-async def fetch_macro_news_with_session():
+async def _record_session_metrics(stagehand, source: str, ticker: str = ""):
+    """Fold one dedicated session's LLM and Browserbase metrics into run_metrics.
+
+    Shared by the macro-news and vital-knowledge session wrappers so the
+    token/proxy/session bookkeeping lives in one place. Returns
+    (session_id, llm_metrics) for the caller's logging and timing entries.
+    """
+    session_id = getattr(stagehand, 'session_id', 'unknown')
+
+    llm_metrics = collect_stagehand_metrics(stagehand)
+    run_metrics["llm_tokens"]["total_prompt_tokens"] += llm_metrics["prompt_tokens"]
+    run_metrics["llm_tokens"]["total_completion_tokens"] += llm_metrics["completion_tokens"]
+    run_metrics["llm_tokens"]["total_inference_time_ms"] += llm_metrics["inference_time_ms"]
+
+    bb_metrics = await collect_browserbase_metrics(session_id)
+    run_metrics["browserbase"]["total_proxy_bytes"] += bb_metrics["proxy_bytes"]
+    _record_session_detail(session_id, source, ticker, bb_metrics)
+
+    run_metrics["sessions"].append(session_id)
+    run_metrics["success_count"] += 1
+    return session_id, llm_metrics
+
+
+async def fetch_macro_news_with_session(days_back: int = 2):
     """Fetch macro news in a dedicated browser session."""
     stagehand = None
     start_time = time.time()
     try:
-        from src.core.stagehand_runner import create_stagehand_session
         stagehand, page = await create_stagehand_session(
             source="MacroNews",
         )
-        # Get days_back from env var, default to 2
-        days_back = int(os.getenv("Vital_Days_Back", "2"))
         result = await fetch_macro_news(page, days_back=days_back)
 
-        # Collect enhanced metrics
         duration = time.time() - start_time
-        session_id = getattr(stagehand, 'session_id', 'unknown')
-
-        # Collect LLM token metrics from stagehand
-        llm_metrics = collect_stagehand_metrics(stagehand)
-        run_metrics["llm_tokens"]["total_prompt_tokens"] += llm_metrics["prompt_tokens"]
-        run_metrics["llm_tokens"]["total_completion_tokens"] += llm_metrics["completion_tokens"]
-        run_metrics["llm_tokens"]["total_inference_time_ms"] += llm_metrics["inference_time_ms"]
-
-        # Collect Browserbase session metrics
-        bb_metrics = await collect_browserbase_metrics(session_id)
-        run_metrics["browserbase"]["total_proxy_bytes"] += bb_metrics["proxy_bytes"]
-        run_metrics["browserbase"]["sessions_detail"].append({
-            "session_id": session_id,
-            "source": "MacroNews",
-            **bb_metrics,
-        })
+        session_id, llm_metrics = await _record_session_metrics(stagehand, "MacroNews")
 
         print(f"[Metrics] MacroNews: {duration:.1f}s, tokens={llm_metrics['prompt_tokens']}+{llm_metrics['completion_tokens']}, session={session_id}")
 
@@ -481,39 +670,21 @@ async def fetch_macro_news_with_session():
                 print(f"[WARN] Error closing Macro News session: {close_error}")
 
 
-async def _run_vital_knowledge_batch(tickers: list[str]):
+async def _run_vital_knowledge_batch(tickers: list[str], days_back: int = 2):
     """Batch fetch Vital Knowledge data for all tickers in a single session."""
     stagehand = None
     start_time = time.time()
     try:
-        from src.core.stagehand_runner import create_stagehand_session
         stagehand, page = await create_stagehand_session(
             source="VitalKnowledge",
             ticker=",".join(tickers),  # e.g., "NVDA,AAPL,MSFT,GOOGL"
         )
-        # Get days_back from env var, default to 2 (same as macro_news)
-        days_back = int(os.getenv("Vital_Days_Back", "2"))
         results = await fetch_vital_knowledge_headlines_batch(page, tickers, days_back=days_back)
 
-        # Collect enhanced metrics
         duration = time.time() - start_time
-        session_id = getattr(stagehand, 'session_id', 'unknown')
-
-        # Collect LLM token metrics from stagehand
-        llm_metrics = collect_stagehand_metrics(stagehand)
-        run_metrics["llm_tokens"]["total_prompt_tokens"] += llm_metrics["prompt_tokens"]
-        run_metrics["llm_tokens"]["total_completion_tokens"] += llm_metrics["completion_tokens"]
-        run_metrics["llm_tokens"]["total_inference_time_ms"] += llm_metrics["inference_time_ms"]
-
-        # Collect Browserbase session metrics
-        bb_metrics = await collect_browserbase_metrics(session_id)
-        run_metrics["browserbase"]["total_proxy_bytes"] += bb_metrics["proxy_bytes"]
-        run_metrics["browserbase"]["sessions_detail"].append({
-            "session_id": session_id,
-            "source": "VitalKnowledge",
-            "tickers": tickers,
-            **bb_metrics,
-        })
+        session_id, llm_metrics = await _record_session_metrics(
+            stagehand, "VitalKnowledge", ", ".join(tickers)
+        )
 
         print(f"[Metrics] VitalKnowledge/batch: {duration:.1f}s, tokens={llm_metrics['prompt_tokens']}+{llm_metrics['completion_tokens']}, session={session_id}")
 
@@ -567,144 +738,311 @@ async def _run_vital_knowledge_batch(tickers: list[str]):
                 print(f"[WARN] Error closing Vital Knowledge batch session: {close_error}")
 
 
-async def _warm_up_yahoo_selector():
-    """
-    Warm up the Yahoo selector cache by running observe() once.
-    This caches the XPath so subsequent per-ticker calls skip observe().
-    """
-    from src.skills.yahoo.quote import _get_or_discover_selector, CACHE_KEY
-
-    stagehand = None
-    try:
+async def _create_pool_session(run_id: str | None = None):
+    """Create and guardrail-check one pooled browser session."""
+    with GuardrailTimer("session_creation"):
         stagehand, page = await create_stagehand_session(
-            source="YahooQuote_Warmup",
+            source="TickerPool",
+            run_id=run_id,
         )
-        await page.goto("https://finance.yahoo.com/quote/AAPL", timeout=30000)
-        selector = await _get_or_discover_selector(page, CACHE_KEY)
-        if selector:
-            print(f"[YahooQuote] Warm-up complete, cached selector: {selector[:60]}...")
-        else:
-            print("[YahooQuote] Warm-up: observe() returned no selector, will use full-page extract")
-    except Exception as e:
-        print(f"[YahooQuote] Warm-up failed: {e} - per-ticker calls will run observe() individually")
-    finally:
-        if stagehand:
+
+    if is_guardrails_enabled():
+        session_diagnostics = await check_session_creation(stagehand, page)
+        if not session_diagnostics.get("session_created", False):
             try:
                 await stagehand.close()
             except Exception:
                 pass
+            raise Exception("Session creation failed")
+
+    run_metrics["sessions"].append(getattr(stagehand, 'session_id', 'unknown'))
+    return stagehand, page
+
+
+async def _create_session_pool(size: int) -> asyncio.Queue:
+    """Pre-launch `size` browser sessions into a checkout pool.
+
+    Tickers check sessions out and return them instead of paying a fresh
+    Chromium launch each, so the pool size (not a separate semaphore) is
+    what bounds browser concurrency.
+    """
+    pool: asyncio.Queue = asyncio.Queue(maxsize=size)
+    # Tolerate partial launches: a single failed Browserbase launch should
+    # shrink the pool, not abort the run and leak the sessions that did
+    # come up. Only an empty pool is fatal.
+    launches = await asyncio.gather(
+        *(_create_pool_session() for _ in range(size)), return_exceptions=True
+    )
+    for launch in launches:
+        if isinstance(launch, BaseException):
+            print(f"[WARN] Pool session launch failed: {launch}")
+        else:
+            pool.put_nowait(launch)
+    if pool.empty():
+        raise RuntimeError(f"Could not launch any of {size} pool session(s)")
+    if pool.qsize() < size:
+        print(f"[Pool] Running with {pool.qsize()}/{size} sessions")
+    return pool
+
+
+async def _checkout_pool_session(pool: asyncio.Queue):
+    """Check a live session out of the pool, respawning lazily if needed.
+
+    A None slot marks a session whose replacement failed at recycle time;
+    it is recreated here so the pool never shrinks permanently. If the
+    respawn fails too, the marker goes back so a later checkout can retry
+    instead of leaving waiters blocked on a short queue.
+    """
+    session = await pool.get()
+    if session is not None:
+        return session
+    try:
+        return await _create_pool_session()
+    except Exception:
+        await pool.put(None)
+        raise
+
+
+async def _close_pool_session(stagehand, session_id: str):
+    """Close one pooled session, containing any teardown error."""
+    try:
+        await stagehand.close()
+    except Exception as close_error:
+        print(f"[WARN] Error closing pooled session {session_id}: {close_error}")
+
+
+async def _close_session_pool(pool: asyncio.Queue):
+    """Drain the pool, collecting final Browserbase metrics and closing each session."""
+    sessions = []
+    while not pool.empty():
+        session = pool.get_nowait()
+        # None slots are respawn markers left by failed replacements.
+        if session is not None:
+            sessions.append(session)
+    if not sessions:
+        return
+
+    # Proxy bytes accrue over each session's whole lifetime, so collect them
+    # once here -- and as one parallel fan-out rather than one serial REST
+    # round trip per session.
+    session_ids = [getattr(stagehand, 'session_id', 'unknown') for stagehand, _page in sessions]
+    bb_results = await asyncio.gather(
+        *(collect_browserbase_metrics(session_id) for session_id in session_ids)
+    )
+    for session_id, bb_metrics in zip(session_ids, bb_results):
+        run_metrics["browserbase"]["total_proxy_bytes"] += bb_metrics["proxy_bytes"]
+        _record_session_detail(session_id, "TickerPool", "", bb_metrics)
+
+    # Session teardowns are independent; overlap them too.
+    await asyncio.gather(
+        *(
+            _close_pool_session(stagehand, session_id)
+            for (stagehand, _page), session_id in zip(sessions, session_ids)
+        )
+    )
+
+
+async def _open_session_pages(stagehand, count: int):
+    """Open `count` extra pages in the session's browser context.
+
+    Returns the new pages, or None if the Stagehand context can't hand out
+    additional pages (caller should fall back to the primary page).
+    """
+    if count <= 0:
+        return []
+    context = getattr(stagehand, "context", None)
+    if context is None or not hasattr(context, "new_page"):
+        return None
+    try:
+        return list(await asyncio.gather(*(context.new_page() for _ in range(count))))
+    except Exception as e:
+        log.info(f"[Pool] Could not open extra pages ({e}); sources will run serially")
+        return None
 
 
 async def process_ticker(
     ticker: str,
-    sem: asyncio.Semaphore,
-    use_yahoo_quote: bool,
-    use_yahoo_analysis: bool,
-    use_marketwatch: bool,
-    use_googlenews: bool,
-    use_vital_knowledge: bool,
+    pool: asyncio.Queue,
+    config: SnapshotConfig,
 ):
-    """Process a single ticker with concurrent source fetches."""
-    print(f"\n=== Processing {ticker} ===")
-
-    # Build list of source tasks to run concurrently
-    source_tasks = []
-    task_info = []  # Track which source each task represents
-
-    # --- Yahoo Quote ---
-    if use_yahoo_quote:
-        print(f"[{ticker}] Starting Yahoo Quote...")
-        source_tasks.append(_run_source_with_session("YahooQuote", ticker, fetch_yahoo_quote, sem))
-        task_info.append("quote")
-
-    # --- Yahoo AI analysis ---
-    if use_yahoo_analysis:
-        print(f"[{ticker}] Starting Yahoo AI...")
-        source_tasks.append(_run_source_with_session("YahooAI", ticker, fetch_yahoo_ai_analysis, sem))
-        task_info.append("analysis")
-
-    # --- MarketWatch Top Stories ---
-    if use_marketwatch:
-        print(f"[{ticker}] Starting MarketWatch...")
-        source_tasks.append(_run_source_with_session("MarketWatch", ticker, fetch_marketwatch_top_stories, sem, max_cards=3))
-        task_info.append("marketwatch")
-
-    # --- Google News ---
-    if use_googlenews:
-        print(f"[{ticker}] Starting Google News...")
-        source_tasks.append(_run_source_with_session("GoogleNews", ticker, fetch_google_news_stories, sem, max_stories=5, max_days=2))
-        task_info.append("googlenews")
-
-    # Run all sources concurrently
-    results = await asyncio.gather(*source_tasks, return_exceptions=True)
-
-    # Map results back to variables
+    """Process a single ticker on a pooled browser session shared across its sources."""
+    log.info(f"\n=== Processing {ticker} ===")
+
     quote = None
     analysis = None
     mw = None
     googlenews = None
     error_messages: list[str] = []
 
-    for task_name, result in zip(task_info, results):
-        if isinstance(result, Exception):
-            error_messages.append(f"{task_name} failed: {result}")
-            result = None
-        elif result is None:
-            error_messages.append(f"{task_name} failed")
+    # Check a live session out of the pool; blocks until one is free.
+    try:
+        stagehand, page = await _checkout_pool_session(pool)
+    except Exception as checkout_error:
+        log.info(f"[WARN] {ticker}: no pool session available ({checkout_error})")
+        return {
+            "ticker": ticker,
+            "error": f"session checkout failed: {checkout_error}",
+            "quote": None,
+            "analysis": None,
+            "marketwatch": None,
+            "googlenews": None,
+            "vital_knowledge": None,
+        }
+    session_id = getattr(stagehand, 'session_id', 'unknown')
+    session_healthy = True
+    start_time = time.time()
+    try:
+        # The session is reused across tickers, so record token deltas for
+        # this ticker rather than the session's cumulative totals.
+        tokens_before = collect_stagehand_metrics(stagehand)
+
+        # Build the list of enabled sources: (source_name, result_key, fetch_func, kwargs)
+        enabled_sources = []
+        if config.use_yahoo_quote:
+            enabled_sources.append(("YahooQuote", "quote", fetch_yahoo_quote, {}))
+        if config.use_yahoo_analysis:
+            enabled_sources.append(("YahooAI", "analysis", fetch_yahoo_ai_analysis, {}))
+        if config.use_marketwatch:
+            enabled_sources.append(("MarketWatch", "marketwatch", fetch_marketwatch_top_stories, {"max_cards": 3}))
+        if config.use_googlenews:
+            # Passing stagehand lets the skill fan article visits out over
+            # sibling tabs in this session's context.
+            enabled_sources.append(("GoogleNews", "googlenews", fetch_google_news_stories, {"max_stories": 5, "max_days": 2, "stagehand": stagehand}))
+
+        # Run the sources concurrently, each on its own page in this session's
+        # browser context, so the ticker costs roughly max(source times)
+        # instead of their sum. If extra pages aren't available, fall back to
+        # running them serially on the primary page.
+        extra_pages = await _open_session_pages(stagehand, len(enabled_sources) - 1)
+        source_results = []
+        try:
+            if extra_pages is not None:
+                pages = [page, *extra_pages]
+                for source_name, _, _, _ in enabled_sources:
+                    log.info(f"[{ticker}] Starting {source_name}...")
+                # _fetch_source_on_page never raises; failures come back as None.
+                source_results = await asyncio.gather(*(
+                    _fetch_source_on_page(source_name, ticker, fetch_func, source_page, session_id, **kwargs)
+                    for (source_name, _, fetch_func, kwargs), source_page in zip(enabled_sources, pages)
+                ))
+            else:
+                for source_name, _, fetch_func, kwargs in enabled_sources:
+                    log.info(f"[{ticker}] Starting {source_name}...")
+                    source_results.append(
+                        await _fetch_source_on_page(source_name, ticker, fetch_func, page, session_id, **kwargs)
+                    )
+        finally:
+            for extra_page in extra_pages or ():
+                try:
+                    await extra_page.close()
+                except Exception:
+                    pass
+
+        results_by_key = {
+            key: result
+            for (_, key, _, _), result in zip(enabled_sources, source_results)
+        }
 
-        if task_name == "quote":
-            quote = result
+        quote = results_by_key.get("quote")
+        if config.use_yahoo_quote:
             if quote:
-                print(f"[YahooQuote] {ticker}: ${quote.last_price}")
-        elif task_name == "analysis":
-            analysis = result
+                log.info(f"[YahooQuote] {ticker}: ${quote.last_price}")
+            else:
+                error_messages.append("quote failed")
+                session_healthy = False
+
+        analysis = results_by_key.get("analysis")
+        if config.use_yahoo_analysis:
             if analysis:
-                print(f"[YahooAI] {ticker}: OK")
-        elif task_name == "marketwatch":
-            mw = result
+                log.info(f"[YahooAI] {ticker}: OK")
+            else:
+                error_messages.append("analysis failed")
+                session_healthy = False
+
+        mw = results_by_key.get("marketwatch")
+        if config.use_marketwatch:
             if mw:
-                print(f"[MarketWatch] {ticker}: {len(mw.stories) if mw.stories else 0} stories")
-        elif task_name == "googlenews":
-            googlenews = result
+                log.info(f"[MarketWatch] {ticker}: {len(mw.stories) if mw.stories else 0} stories")
+            else:
+                error_messages.append("marketwatch failed")
+                session_healthy = False
+
+        googlenews = results_by_key.get("googlenews")
+        if config.use_googlenews:
             if googlenews:
                 articles_count = len([s for s in googlenews.stories if s.summary and not s.summary.startswith("Error")])
-                print(f"[GoogleNews] {ticker}: {articles_count} articles analyzed")
+                log.info(f"[GoogleNews] {ticker}: {articles_count} articles analyzed")
+            else:
+                error_messages.append("googlenews failed")
+                session_healthy = False
+
+        duration = time.time() - start_time
+
+        tokens_after = collect_stagehand_metrics(stagehand)
+        prompt_tokens = tokens_after["prompt_tokens"] - tokens_before["prompt_tokens"]
+        completion_tokens = tokens_after["completion_tokens"] - tokens_before["completion_tokens"]
+        run_metrics["llm_tokens"]["total_prompt_tokens"] += prompt_tokens
+        run_metrics["llm_tokens"]["total_completion_tokens"] += completion_tokens
+        run_metrics["llm_tokens"]["total_inference_time_ms"] += (
+            tokens_after["inference_time_ms"] - tokens_before["inference_time_ms"]
+        )
+
+        log.info(f"[Metrics] {ticker}: {duration:.1f}s, tokens={prompt_tokens}+{completion_tokens}, session={session_id}")
+    finally:
+        # Health check: if any fetch on this session failed, recycle it so
+        # the next ticker doesn't inherit a wedged browser.
+        if not session_healthy:
+            log.info(f"[Pool] Recycling session {session_id} after failures on {ticker}")
+            try:
+                await stagehand.close()
+            except Exception:
+                pass
+            try:
+                stagehand, page = await _create_pool_session()
+            except Exception as replace_error:
+                log.info(f"[WARN] Could not replace unhealthy session {session_id}: {replace_error}")
+                stagehand = None
+        if stagehand is not None:
+            await pool.put((stagehand, page))
+        else:
+            # Keep the slot alive as a respawn marker so pool.get() waiters
+            # can't deadlock; the next checkout recreates the session.
+            await pool.put(None)
 
-    # Note: Vital Knowledge is processed in batch outside of this function
+    # Note: Vital Knowledge is processed in batch outside of this function.
+    # The pydantic objects are returned as-is; they are only dumped to JSON
+    # once, at the snapshot write boundary.
     return {
         "ticker": ticker,
         "error": "; ".join(error_messages) if error_messages else None,
-        "quote": quote.model_dump() if quote else None,
-        "analysis": analysis.model_dump() if analysis else None,
-        "marketwatch": mw.model_dump() if mw else None,
-        "googlenews": googlenews.model_dump() if googlenews else None,
+        "quote": quote,
+        "analysis": analysis,
+        "marketwatch": mw,
+        "googlenews": googlenews,
         "vital_knowledge": None,  # Will be filled from batch results
     }
 
 
-async def main():
+async def main(config: SnapshotConfig | None = None):
     run_metrics["pipeline_start_time"] = time.time()  # Record start time for wall-clock duration
 
-    use_yahoo_quote = _env_flag("ENABLE_YAHOO_QUOTE", True)
-    use_yahoo_analysis = _env_flag("ENABLE_YAHOO_ANALYSIS", True)
-    use_marketwatch = _env_flag("ENABLE_MARKETWATCH", True)
-    use_googlenews = _env_flag("ENABLE_GOOGLE_NEWS", True)
-    use_vital_knowledge = _env_flag("ENABLE_VITAL_NEWS", True)
-    use_macro_news = _env_flag("ENABLE_MACRO_NEWS", True)
+    if config is None:
+        config = load_snapshot_config()
 
     print(
         "Sources enabled:",
-        f"yahoo_quote={use_yahoo_quote},",
-        f"yahoo_analysis={use_yahoo_analysis},",
-        f"marketwatch={use_marketwatch},",
-        f"googlenews={use_googlenews},",
-        f"vital_knowledge={use_vital_knowledge},",
-        f"macro_news={use_macro_news}",
+        f"yahoo_quote={config.use_yahoo_quote},",
+        f"yahoo_analysis={config.use_yahoo_analysis},",
+        f"marketwatch={config.use_marketwatch},",
+        f"googlenews={config.use_googlenews},",
+        f"vital_knowledge={config.use_vital_knowledge},",
+        f"macro_news={config.use_macro_news}",
     )
 
-    # Load watchlist
+    # Load watchlist. Tickers end up as dict keys in the batch-result and
+    # per-source metrics maps, so intern them once for identity-fast lookups.
     if WATCHLIST_PATH.exists():
-        watchlist = json.loads(WATCHLIST_PATH.read_text())
+        watchlist = [sys.intern(t) for t in _json_loads(WATCHLIST_PATH.read_bytes())]
     else:
         watchlist = ["AAPL", "GOOGL"]
 
@@ -712,139 +1050,128 @@ async def main():
     REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
     today = date.today()
-    snapshot_path = SNAPSHOT_DIR / f"yahoo_snapshot_{today.isoformat()}.json"
-    mw_snapshot_path = SNAPSHOT_DIR / f"marketwatch_snapshot_{today.isoformat()}.json"
-    googlenews_snapshot_path = SNAPSHOT_DIR / f"googlenews_snapshot_{today.isoformat()}.json"
-    vital_knowledge_snapshot_path = SNAPSHOT_DIR / f"vital_knowledge_snapshot_{today.isoformat()}.json"
-    macro_news_snapshot_path = SNAPSHOT_DIR / f"macro_news_snapshot_{today.isoformat()}.json"
-    report_path = REPORTS_DIR / f"morning_snapshot_{today.isoformat()}.md"
-
-    max_concurrent = _get_max_concurrent_browsers()
+    today_iso = today.isoformat()
+
+    def _snap(name: str) -> Path:
+        return SNAPSHOT_DIR / f"{name}_{today_iso}.json"
+
+    snapshot_path = _snap("yahoo_snapshot")
+    mw_snapshot_path = _snap("marketwatch_snapshot")
+    googlenews_snapshot_path = _snap("googlenews_snapshot")
+    vital_knowledge_snapshot_path = _snap("vital_knowledge_snapshot")
+    macro_news_snapshot_path = _snap("macro_news_snapshot")
+    report_path = REPORTS_DIR / f"morning_snapshot_{today_iso}.md"
+
+    max_concurrent = config.max_concurrent_browsers
     print(f"Using MAX_CONCURRENT_BROWSERS = {max_concurrent}")
-    sem = asyncio.Semaphore(max_concurrent)
 
-    # Warm up Yahoo selector cache (one short session)
-    if use_yahoo_quote:
-        print("\n[YahooQuote] Running selector warm-up...")
-        await _warm_up_yahoo_selector()
+    print(f"\n[Pool] Launching {max_concurrent} pooled browser session(s)...")
+    pool = await _create_session_pool(max_concurrent)
 
     ticker_tasks = [
-        process_ticker(ticker, sem, use_yahoo_quote, use_yahoo_analysis, use_marketwatch, use_googlenews, use_vital_knowledge)
+        asyncio.create_task(
+            process_ticker(ticker, pool, config)
+        )
         for ticker in watchlist
     ]
 
-    all_tasks = list(ticker_tasks)
-    macro_news_result = None
-    if use_macro_news:
+    macro_news_task = None
+    if config.use_macro_news:
         print("\n[MacroNews] Starting macro news fetch (independent browser session)...")
-        macro_news_task = fetch_macro_news_with_session()
-        all_tasks.append(macro_news_task)
+        macro_news_task = asyncio.create_task(fetch_macro_news_with_session(days_back=config.vital_days_back))
 
-    vital_knowledge_batch_results = None
-    if use_vital_knowledge:
+    vital_knowledge_batch_task = None
+    if config.use_vital_knowledge:
         print(f"\n[VitalKnowledge] Starting batch fetch for {len(watchlist)} tickers (independent browser session)...")
-        vital_knowledge_batch_task = _run_vital_knowledge_batch(watchlist)
-        all_tasks.append(vital_knowledge_batch_task)
-
-    all_results = await asyncio.gather(*all_tasks)
-
-    results = all_results[:len(ticker_tasks)]
-
-    if use_macro_news:
-        macro_news_result = all_results[len(ticker_tasks)]
-        if use_vital_knowledge:
-            vital_knowledge_batch_results = all_results[len(ticker_tasks) + 1]
-    elif use_vital_knowledge:
-        vital_knowledge_batch_results = all_results[len(ticker_tasks)]
-    if use_vital_knowledge and vital_knowledge_batch_results:
+        vital_knowledge_batch_task = asyncio.create_task(_run_vital_knowledge_batch(watchlist, days_back=config.vital_days_back))
+
+    # Stream per-ticker results to an NDJSON file as each ticker finishes,
+    # so the slowest ticker no longer blocks the first bytes hitting disk.
+    stream_path = SNAPSHOT_DIR / f"ticker_stream_{today_iso}.ndjson"
+    results = []
+    with open(stream_path, "wb") as stream:
+        for coro in asyncio.as_completed(ticker_tasks):
+            item = await coro
+            results.append(item)
+            stream.write(_json_dumps(item) + b"\n")
+    print(f"\nTicker stream written to: {stream_path}")
+
+    # All tickers are done; tear the session pool down before draining the
+    # independent macro/vital-knowledge sessions.
+    await _close_session_pool(pool)
+
+    # Drain the independent macro/vital-knowledge sessions last.
+    macro_news_result = await macro_news_task if macro_news_task else None
+    vital_knowledge_batch_results = await vital_knowledge_batch_task if vital_knowledge_batch_task else None
+    if config.use_vital_knowledge and vital_knowledge_batch_results:
         print("\n[Merging] Adding Vital Knowledge batch results to ticker data...")
         for item in results:
             ticker = item.get("ticker")
             if ticker in vital_knowledge_batch_results:
-                item["vital_knowledge"] = vital_knowledge_batch_results[ticker].model_dump()
+                item["vital_knowledge"] = vital_knowledge_batch_results[ticker]
                 headlines_count = len(vital_knowledge_batch_results[ticker].headlines) if vital_knowledge_batch_results[ticker].headlines else 0
                 print(f"[VitalKnowledge] {ticker}: {headlines_count} headlines from batch")
             else:
                 print(f"[WARN] {ticker}: No Vital Knowledge data from batch")
 
-    yahoo_snapshot = {
-        "as_of": today.isoformat(),
-        "tickers": [
-            {
-                "ticker": item.get("ticker"),
-                "error": item.get("error"),
-                "quote": item.get("quote"),
-                "analysis": item.get("analysis"),
-            }
-            for item in results
-        ],
-    }
-    snapshot_path.write_text(json.dumps(yahoo_snapshot, indent=2), encoding="utf-8")
-    print(f"\nYahoo snapshot written to: {snapshot_path}")
-
-    mw_snapshot = {
-        "as_of": today.isoformat(),
-        "tickers": [
-            {
-                "ticker": item.get("ticker"),
-                "error": item.get("error"),
-                "marketwatch": item.get("marketwatch"),
-            }
-            for item in results
-        ],
-    }
-    mw_snapshot_path.write_text(json.dumps(mw_snapshot, indent=2), encoding="utf-8")
-    print(f"MarketWatch snapshot written to: {mw_snapshot_path}")
-
-    googlenews_snapshot = {
-        "as_of": today.isoformat(),
-        "tickers": [
-            {
-                "ticker": item.get("ticker"),
-                "error": item.get("error"),
-                "googlenews": item.get("googlenews"),
-            }
-            for item in results
-        ],
-    }
-    googlenews_snapshot_path.write_text(json.dumps(googlenews_snapshot, indent=2), encoding="utf-8")
-    print(f"Google News snapshot written to: {googlenews_snapshot_path}")
-
-    vital_knowledge_snapshot = {
-        "as_of": today.isoformat(),
-        "tickers": [
-            {
-                "ticker": item.get("ticker"),
-                "error": item.get("error"),
-                "vital_knowledge": item.get("vital_knowledge"),
-            }
-            for item in results
-        ],
+    # Build all snapshot envelopes in one pass over `results`, serialize once,
+    # then overlap the disk writes instead of serializing/writing one by one.
+    yahoo_entries = []
+    mw_entries = []
+    googlenews_entries = []
+    vital_knowledge_entries = []
+    for item in results:
+        ticker = item.get("ticker")
+        error = item.get("error")
+        yahoo_entries.append(_YahooEntry.model_construct(
+            ticker=ticker, error=error,
+            quote=item.get("quote"), analysis=item.get("analysis"),
+        ))
+        mw_entries.append(_MarketWatchEntry.model_construct(
+            ticker=ticker, error=error, marketwatch=item.get("marketwatch"),
+        ))
+        googlenews_entries.append(_GoogleNewsEntry.model_construct(
+            ticker=ticker, error=error, googlenews=item.get("googlenews"),
+        ))
+        vital_knowledge_entries.append(_VitalKnowledgeEntry.model_construct(
+            ticker=ticker, error=error, vital_knowledge=item.get("vital_knowledge"),
+        ))
+
+    snapshots = {
+        snapshot_path: _YahooSnapshot.model_construct(as_of=today_iso, tickers=yahoo_entries),
+        mw_snapshot_path: _MarketWatchSnapshot.model_construct(as_of=today_iso, tickers=mw_entries),
+        googlenews_snapshot_path: _GoogleNewsSnapshot.model_construct(as_of=today_iso, tickers=googlenews_entries),
+        vital_knowledge_snapshot_path: _VitalKnowledgeSnapshot.model_construct(as_of=today_iso, tickers=vital_knowledge_entries),
     }
-    vital_knowledge_snapshot_path.write_text(json.dumps(vital_knowledge_snapshot, indent=2), encoding="utf-8")
-    print(f"Vital Knowledge snapshot written to: {vital_knowledge_snapshot_path}")
+    if config.use_macro_news:
+        snapshots[macro_news_snapshot_path] = _MacroNewsSnapshot.model_construct(
+            as_of=today_iso,
+            macro_news=macro_news_result,
+        )
 
-    if use_macro_news:
-        macro_news_snapshot = {
-            "as_of": today.isoformat(),
-            "macro_news": macro_news_result.model_dump() if macro_news_result else None,
-        }
-        macro_news_snapshot_path.write_text(json.dumps(macro_news_snapshot, indent=2), encoding="utf-8")
-        print(f"Macro News snapshot written to: {macro_news_snapshot_path}")
+    payloads = {
+        path: snapshot.model_dump_json().encode("utf-8")
+        for path, snapshot in snapshots.items()
+    }
+    await asyncio.gather(
+        *(asyncio.to_thread(_atomic_write_bytes, path, payload) for path, payload in payloads.items())
+    )
+    for path in payloads:
+        print(f"Snapshot written to: {path}")
 
+    # The items already hold validated pydantic objects from process_ticker,
+    # so the report can use them directly -- no dump/re-validate round trip.
     typed_items = []
     for item in results:
         ticker = item.get("ticker")
 
-        if not item.get("quote"):
+        q = item.get("quote")
+        if not q:
             print(f"[WARN] Skipping {ticker} in report (no quote data)")
             continue
 
-        q = YahooQuoteSnapshot(**item["quote"])
-
-        if item.get("analysis"):
-            a = YahooAIAnalysis(**item["analysis"])
-        else:
+        a = item.get("analysis")
+        if not a:
             print(f"[WARN] {ticker}: no Yahoo AI analysis; using empty analysis object")
             a = YahooAIAnalysis(
                 ticker=ticker,
@@ -853,52 +1180,14 @@ async def main():
                 bullets=[],
             )
 
-        mw_obj = None
-        if item.get("marketwatch"):
-            try:
-                mw_obj = MarketWatchTopStories(**item["marketwatch"])
-            except Exception as e:
-                print(f"[WARN] {ticker}: failed to parse MarketWatchTopStories: {e}")
-                error_tracker = get_error_tracker()
-                error_tracker.record_error(
-                    error=e,
-                    component="parse_MarketWatchTopStories",
-                    context={"ticker": ticker},
-                )
-                mw_obj = None
-
-        googlenews_obj = None
-        if item.get("googlenews"):
-            try:
-                googlenews_obj = GoogleNewsTopStories(**item["googlenews"])
-            except Exception as e:
-                print(f"[WARN] {ticker}: failed to parse GoogleNewsTopStories: {e}")
-                error_tracker = get_error_tracker()
-                error_tracker.record_error(
-                    error=e,
-                    component="parse_GoogleNewsTopStories",
-                    context={"ticker": ticker},
-                )
-                googlenews_obj = None
-
-        vital_knowledge_obj = None
-        if item.get("vital_knowledge"):
-            try:
-                vital_knowledge_obj = VitalKnowledgeReport(**item["vital_knowledge"])
-            except Exception as e:
-                print(f"[WARN] {ticker}: failed to parse VitalKnowledgeReport: {e}")
-                error_tracker = get_error_tracker()
-                error_tracker.record_error(
-                    error=e,
-                    component="parse_VitalKnowledgeReport",
-                    context={"ticker": ticker},
-                )
-                vital_knowledge_obj = None
+        mw_obj = item.get("marketwatch")
+        googlenews_obj = item.get("googlenews")
+        vital_knowledge_obj = item.get("vital_knowledge")
 
         if item.get("error"):
             print(f"[INFO] {ticker} had source errors: {item['error']}")
 
-        typed_items.append((q, a, mw_obj, googlenews_obj, vital_knowledge_obj))
+        typed_items.append(TickerBundle(q, a, mw_obj, googlenews_obj, vital_knowledge_obj))
 
         # Collect quality metrics for this ticker
         ticker_quality = {
@@ -915,40 +1204,32 @@ async def main():
         save_baseline_metrics(step=1, name="phase1")
         return
 
-    macro_news_obj = None
-    if use_macro_news and macro_news_result:
-        try:
-            macro_news_obj = MacroNewsSummary(**macro_news_result.model_dump())
-        except Exception as e:
-            print(f"[WARN] Failed to parse MacroNewsSummary: {e}")
-            error_tracker = get_error_tracker()
-            error_tracker.record_error(
-                error=e,
-                component="parse_MacroNewsSummary",
-                context={},
-            )
-            macro_news_obj = None
+    macro_news_obj = macro_news_result if config.use_macro_news else None
 
     report_md = build_morning_report(today, typed_items, macro_news_obj)
-    report_path.write_text(report_md, encoding="utf-8")
+    _atomic_write_bytes(report_path, report_md.encode("utf-8"))
     print(f"Morning Snapshot written to: {report_path}")
     
     # Print error summary if any errors occurred
     error_tracker = get_error_tracker()
+    error_tracker.flush()
     summary = error_tracker.get_summary()
     if summary["total_errors"] > 0:
         error_summary_path = error_tracker.get_file_path_for_llm()
-        print(f"\n[ERRORS] {summary['total_errors']} error(s) occurred. Summary: {error_summary_path}")
-        print(f"  Most problematic component: {summary['summary']['most_problematic_component']['component']}")
-        print(f"  Error summary file: {error_summary_path}")
+        sys.stdout.write(
+            f"\n[ERRORS] {summary['total_errors']} error(s) occurred. Summary: {error_summary_path}\n"
+            f"  Most problematic component: {summary['summary']['most_problematic_component']['component']}\n"
+            f"  Error summary file: {error_summary_path}\n"
+        )
 
     # Save metrics for Phase 1
     save_baseline_metrics(step=1, name="phase1")
 
 
 def main_cli():
+    config = load_snapshot_config()
     try:
-        asyncio.run(main())
+        asyncio.run(main(config))
     except Exception as e:
         error_tracker = get_error_tracker()
         error_tracker.record_error(
@@ -956,9 +1237,12 @@ def main_cli():
             component="main_pipeline",
             context={},
         )
+        error_tracker.flush()
         error_summary_path = error_tracker.get_file_path_for_llm()
-        print(f"\n[FATAL ERROR] Pipeline failed: {e}")
-        print(f"Error summary saved to: {error_summary_path}")
+        sys.stdout.write(
+            f"\n[FATAL ERROR] Pipeline failed: {e}\n"
+            f"Error summary saved to: {error_summary_path}\n"
+        )
         raise
 
 
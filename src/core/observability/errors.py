@@ -1,11 +1,31 @@
 """Error tracking focused on identifying what went wrong and which files/components failed."""
 
+import atexit
+import io
 import json
+import itertools
+import os
+import time
 import traceback
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj, *, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson's Rust encoder when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 
 class ErrorTracker:
     """
@@ -18,25 +38,58 @@ class ErrorTracker:
     """
     
     def __init__(self):
-        self.errors: List[Dict[str, Any]] = []
+        # Only the most recent records are kept for the summary tail; running
+        # counters below carry the aggregates, so memory stays bounded no
+        # matter how many errors a run produces.
+        self.errors: deque = deque(maxlen=10)
+        self.total_errors = 0
+        self._by_component: Dict[str, int] = {}
+        self._by_error_type: Dict[str, int] = {}
+        # Running (name, count) maxima so get_summary never scans the dicts.
+        self._most_problematic = (None, 0)
+        self._most_common_type = (None, 0)
+        self._last_summary_flush = 0.0
+        # Records waiting to be written to disk. record_error only appends
+        # here (O(1)); serialization and file I/O happen in flush().
+        # Deliberately unbounded: self.errors keeps only a 10-entry tail, so
+        # this buffer is the sole route to the daily jsonl and capping it
+        # would silently drop records in exactly the failure-cascade runs it
+        # exists for. Records are small dicts and the I/O is merely deferred,
+        # so memory stays proportional to one run's error count.
+        self._pending: deque = deque()
         self.errors_dir = Path("data/errors")
         self.errors_dir.mkdir(parents=True, exist_ok=True)
         self.today = datetime.now().strftime("%Y-%m-%d")
+        # Precomputed filename prefix plus a counter suffix: unique names
+        # without a per-error strftime (which also collided within a second).
+        self._today_prefix = f"error_{self.today}_"
+        self._counter = itertools.count()
+        # The daily jsonl already captures every record, so the one-file-per-
+        # error copies are opt-in for debugging sessions.
+        self._verbose_files = os.getenv("VERBOSE_ERROR_FILES", "false").strip().lower() in (
+            "1", "true", "yes", "y", "on"
+        )
+        self._daily_log_fh = None
+        self._summary_json_fh = None
+        self._summary_text_fh = None
         # Clear old error files when a new tracker is created (fresh start for each run)
         self._clear_old_errors()
+        atexit.register(self.flush)
 
     def _clear_old_errors(self):
         """Delete all existing error files to start fresh for this run."""
         if not self.errors_dir.exists():
             return
 
+        # glob batches the directory scan and unlink fails harmlessly on the
+        # odd directory, so no per-entry is_file() stat is needed.
         deleted_count = 0
-        for file in self.errors_dir.iterdir():
-            if file.is_file() and file.suffix in (".json", ".jsonl", ".txt"):
+        for pattern in ("*.json", "*.jsonl", "*.txt"):
+            for file in self.errors_dir.glob(pattern):
                 try:
-                    file.unlink()
+                    file.unlink(missing_ok=True)
                     deleted_count += 1
-                except Exception as e:
+                except OSError as e:
                     print(f"[ErrorTracker] Could not delete {file.name}: {e}")
 
         if deleted_count > 0:
@@ -68,9 +121,9 @@ class ErrorTracker:
             session_url = f"https://www.browserbase.com/sessions/{session_id}"
 
         error_record = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "component": component,  # Which file/component failed
-            "error_type": type(error).__name__,
+            "error_type": error.__class__.__name__,
             "error_message": str(error),
             "context": context or {},
             "failure_point": failure_point,  # Which stage failed
@@ -81,146 +134,179 @@ class ErrorTracker:
         }
         
         self.errors.append(error_record)
-        self._save_error(error_record)
-        self._update_summary()
+        self.total_errors += 1
+        component_count = self._by_component.get(component, 0) + 1
+        self._by_component[component] = component_count
+        if component_count > self._most_problematic[1]:
+            self._most_problematic = (component, component_count)
+        error_type = error_record["error_type"]
+        type_count = self._by_error_type.get(error_type, 0) + 1
+        self._by_error_type[error_type] = type_count
+        if type_count > self._most_common_type[1]:
+            self._most_common_type = (error_type, type_count)
+        self._pending.append(error_record)
     
+    def flush(self):
+        """Write buffered error records and refresh the summary files.
+
+        Called at end-of-run (and via atexit) so the failure path inside the
+        pipeline stays in-memory only; a burst of scraper errors no longer
+        pays per-error file writes and summary rebuilds.
+        """
+        if not self._pending:
+            return
+        while self._pending:
+            self._save_error(self._pending.popleft())
+        if self._daily_log_fh is not None:
+            self._daily_log_fh.flush()
+        self._update_summary(force=True)
+
     def _extract_relevant_traceback(self, error: Exception) -> str:
-        """Extract relevant traceback focusing on our code with file paths."""
-        tb_lines = traceback.format_exception(type(error), error, error.__traceback__)
-        
-        # Extract file paths and relevant stack frames
-        relevant_lines = []
-        for line in tb_lines:
-            line = line.strip()
-            # Include lines that mention our source files
-            if "src/" in line or "File" in line:
-                relevant_lines.append(line)
-        
-        # If no relevant lines, return full traceback
-        if not relevant_lines:
-            return "\n".join(tb_lines)
-        
-        return "\n".join(relevant_lines)
+        """Extract relevant traceback focusing on our code with file paths.
+
+        Filters on FrameSummary.filename before formatting, so frames deep in
+        third-party code are never rendered to strings at all.
+        """
+        frames = traceback.extract_tb(error.__traceback__)
+        relevant = [f for f in frames if "src/" in f.filename]
+        if not relevant:
+            relevant = frames
+        return (
+            "".join(traceback.format_list(relevant))
+            + f"{error.__class__.__name__}: {error}\n"
+        )
     
+    def _daily_log_handle(self):
+        """Open the buffered append-only daily log handle on first write."""
+        if self._daily_log_fh is None:
+            self._daily_log_fh = open(
+                self.errors_dir / f"errors_{self.today}.jsonl", "ab", buffering=1024 * 1024
+            )
+        return self._daily_log_fh
+
     def _save_error(self, error_record: Dict[str, Any]):
         """Save individual error to file."""
-        error_file = (
-            self.errors_dir 
-            / f"error_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}_{error_record['component']}.json"
-        )
-        
-        with open(error_file, "w") as f:
-            json.dump(error_record, f, indent=2)
+        if self._verbose_files:
+            error_file = (
+                self.errors_dir 
+                / f"{self._today_prefix}{next(self._counter)}_{error_record['component']}.json"
+            )
+            with open(error_file, "wb") as f:
+                f.write(_json_dumps(error_record, indent=True))
         
-        # Also append to daily error log
-        daily_log = self.errors_dir / f"errors_{self.today}.jsonl"
-        with open(daily_log, "a") as f:
-            f.write(json.dumps(error_record) + "\n")
+        # Append to daily error log via a handle kept open for the run,
+        # so each record costs one buffered write instead of open/write/close.
+        self._daily_log_handle().write(_json_dumps(error_record) + b"\n")
     
-    def _update_summary(self):
-        """Create/update summary file that's easy for humans and LLMs to read."""
+    def _rewrite(self, fh, data: bytes):
+        """Replace a kept-open summary file's contents in place."""
+        fh.seek(0)
+        fh.truncate()
+        fh.write(data)
+        fh.flush()
+
+    def _update_summary(self, force: bool = False):
+        """Create/update summary file that's easy for humans and LLMs to read.
+
+        Rewriting both summary files per call is O(total errors written), so
+        unforced updates are rate-limited to one rewrite every 2 seconds;
+        flush() forces a final, current write at end-of-run. Both handles are
+        opened once and rewritten via seek+truncate, not reopened per update.
+        """
+        now = time.monotonic()
+        if not force and now - self._last_summary_flush < 2.0:
+            return
+        self._last_summary_flush = now
         summary = self.get_summary()
         
-        summary_file = self.errors_dir / f"error_summary_{self.today}.json"
-        with open(summary_file, "w") as f:
-            json.dump(summary, f, indent=2)
+        if self._summary_json_fh is None:
+            self._summary_json_fh = open(self.errors_dir / f"error_summary_{self.today}.json", "w+b")
+            self._summary_text_fh = open(self.errors_dir / f"error_summary_{self.today}.txt", "w+b")
         
-        # Also create human-readable summary
-        summary_text_file = self.errors_dir / f"error_summary_{self.today}.txt"
-        with open(summary_text_file, "w") as f:
-            f.write(self._format_summary_text(summary))
+        self._rewrite(self._summary_json_fh, _json_dumps(summary, indent=True))
+        self._rewrite(self._summary_text_fh, self._format_summary_text(summary).encode("utf-8"))
     
     def get_summary(self) -> Dict[str, Any]:
         """Get summary of all errors for easy consumption by LLMs."""
-        if not self.errors:
+        if not self.total_errors:
             return {
                 "total_errors": 0,
                 "status": "no_errors",
                 "message": "No errors occurred in this run.",
             }
         
-        # Group errors by component
-        by_component: Dict[str, List[Dict[str, Any]]] = {}
-        by_error_type: Dict[str, int] = {}
-        
-        for error in self.errors:
-            component = error["component"]
-            error_type = error["error_type"]
-            
-            if component not in by_component:
-                by_component[component] = []
-            by_component[component].append(error)
-            
-            by_error_type[error_type] = by_error_type.get(error_type, 0) + 1
-        
-        # Find most common errors
-        most_common_component = max(by_component.items(), key=lambda x: len(x[1]), default=(None, []))
-        most_common_error_type = max(by_error_type.items(), key=lambda x: x[1], default=(None, 0))
+        # Groupings and maxima come from the running aggregates kept by
+        # record_error, so assembling the summary is O(1) apart from copying
+        # the small counter dicts and the 10-entry tail.
+        most_common_component = self._most_problematic
+        most_common_error_type = self._most_common_type
         
         return {
-            "total_errors": len(self.errors),
+            "total_errors": self.total_errors,
             "status": "errors_occurred",
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "summary": {
-                "errors_by_component": {
-                    component: len(errors) 
-                    for component, errors in by_component.items()
-                },
-                "errors_by_type": by_error_type,
+                "errors_by_component": dict(self._by_component),
+                "errors_by_type": dict(self._by_error_type),
                 "most_problematic_component": {
                     "component": most_common_component[0],
-                    "error_count": len(most_common_component[1]),
+                    "error_count": most_common_component[1],
                 } if most_common_component[0] else None,
                 "most_common_error_type": {
                     "error_type": most_common_error_type[0],
                     "count": most_common_error_type[1],
                 } if most_common_error_type[0] else None,
             },
-            "errors": self.errors[-10:],  # Last 10 errors for context
+            "errors": list(self.errors),  # Last 10 errors for context
         }
     
     def _format_summary_text(self, summary: Dict[str, Any]) -> str:
-        """Format summary as human-readable text."""
-        lines = [
-            "=" * 60,
-            "ERROR SUMMARY",
-            "=" * 60,
-            "",
-            f"Total Errors: {summary['total_errors']}",
-            f"Status: {summary['status']}",
-            "",
-        ]
-        
+        """Format summary as human-readable text.
+
+        Each line is written straight into a StringIO buffer with its
+        trailing newline (trimmed once at the end, matching join semantics)
+        instead of accumulating a Python list and joining it.
+        """
+        buf = io.StringIO()
+        write = buf.write
+        write("=" * 60 + "\n")
+        write("ERROR SUMMARY\n")
+        write("=" * 60 + "\n")
+        write("\n")
+        write(f"Total Errors: {summary['total_errors']}\n")
+        write(f"Status: {summary['status']}\n")
+        write("\n")
+
         if summary["status"] == "no_errors":
-            lines.append("✅ No errors occurred in this run.")
-            return "\n".join(lines)
-        
+            write("✅ No errors occurred in this run.\n")
+            return buf.getvalue()[:-1]
+
         # Errors by component
         if "errors_by_component" in summary.get("summary", {}):
-            lines.append("Errors by Component:")
+            write("Errors by Component:\n")
             for component, count in summary["summary"]["errors_by_component"].items():
-                lines.append(f"  - {component}: {count} error(s)")
-            lines.append("")
-        
+                write(f"  - {component}: {count} error(s)\n")
+            write("\n")
+
         # Most problematic component
         if summary["summary"].get("most_problematic_component"):
             component_info = summary["summary"]["most_problematic_component"]
-            lines.append(f"Most Problematic Component: {component_info['component']} ({component_info['error_count']} errors)")
-            lines.append("")
-        
+            write(f"Most Problematic Component: {component_info['component']} ({component_info['error_count']} errors)\n")
+            write("\n")
+
         # Recent errors
         if summary.get("errors"):
-            lines.append("Recent Errors:")
+            write("Recent Errors:\n")
             for error in summary["errors"][:5]:  # Show last 5
-                lines.append(f"\n  Component: {error['component']}")
-                lines.append(f"  Error: {error['error_type']}: {error['error_message']}")
+                write(f"\n  Component: {error['component']}\n")
+                write(f"  Error: {error['error_type']}: {error['error_message']}\n")
                 if error.get("context"):
                     ctx_str = ", ".join(f"{k}={v}" for k, v in error["context"].items())
-                    lines.append(f"  Context: {ctx_str}")
+                    write(f"  Context: {ctx_str}\n")
                 if error.get("session_url"):
-                    lines.append(f"  Session: {error['session_url']}")
+                    write(f"  Session: {error['session_url']}\n")
 
-        return "\n".join(lines)
+        return buf.getvalue()[:-1]
     
     def get_file_path_for_llm(self) -> str:
         """Get path to summary file that LLMs can read."""
@@ -2,24 +2,41 @@
 
 import os
 import time
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+# Resolved once at import: the env var doesn't change at runtime, and the
+# checks below run inside hot per-page paths.
+_GUARDRAILS_ENABLED = os.getenv("ENABLE_GUARDRAILS", "true").strip().lower() in (
+    "1", "true", "yes", "y", "on"
+)
+
+
+# Shared read-only result for disabled checks: no per-call dict allocation,
+# and .get() on it behaves like the old all-False diagnostics.
+_EMPTY_DIAG = MappingProxyType({})
+
+
 def is_guardrails_enabled() -> bool:
     """Check if guardrails are enabled via environment variable."""
-    raw = os.getenv("ENABLE_GUARDRAILS", "true")
-    return raw.strip().lower() in ("1", "true", "yes", "y", "on")
+    return _GUARDRAILS_ENABLED
 
 
-async def check_page_navigation(page, expected_url: str) -> Dict[str, Any]:
+async def check_page_navigation(page, expected_url: str, include_title: bool = False) -> Dict[str, Any]:
     """
     Check if page navigation succeeded.
     
-    Returns diagnostics about navigation state.
+    Returns diagnostics about navigation state. page.title() is a CDP
+    round-trip to the browser, so it is only fetched when include_title
+    is set; page.url is a local property and always recorded.
     """
+    if not _GUARDRAILS_ENABLED:
+        return _EMPTY_DIAG
+
     diagnostics = {
         "navigation_success": False,
         "expected_url": expected_url,
@@ -28,12 +45,9 @@ async def check_page_navigation(page, expected_url: str) -> Dict[str, Any]:
         "page_accessible": False,
     }
     
-    if not is_guardrails_enabled():
-        return diagnostics
-    
     try:
         actual_url = page.url
-        page_title = await page.title()
+        page_title = await page.title() if include_title else None
         
         diagnostics.update({
             "navigation_success": actual_url == expected_url or expected_url in actual_url,
@@ -48,12 +62,16 @@ async def check_page_navigation(page, expected_url: str) -> Dict[str, Any]:
     return diagnostics
 
 
-async def check_page_state(page) -> Dict[str, Any]:
+async def check_page_state(page, include_title: bool = False) -> Dict[str, Any]:
     """
     Check current page state before extraction.
     
-    Returns diagnostics about page accessibility and state.
+    Returns diagnostics about page accessibility and state. As with
+    check_page_navigation, the title round-trip is opt-in.
     """
+    if not _GUARDRAILS_ENABLED:
+        return _EMPTY_DIAG
+
     diagnostics = {
         "page_accessible": False,
         "current_url": None,
@@ -61,12 +79,9 @@ async def check_page_state(page) -> Dict[str, Any]:
         "ready_for_extraction": False,
     }
     
-    if not is_guardrails_enabled():
-        return diagnostics
-    
     try:
         url = page.url
-        title = await page.title()
+        title = await page.title() if include_title else None
         
         # Try simple operation to verify page is responsive
         diagnostics.update({
@@ -91,15 +106,15 @@ async def check_session_creation(stagehand, page) -> Dict[str, Any]:
     
     Returns diagnostics about session state.
     """
+    if not _GUARDRAILS_ENABLED:
+        return _EMPTY_DIAG
+
     diagnostics = {
         "session_created": False,
         "page_object_valid": False,
         "page_accessible": False,
     }
     
-    if not is_guardrails_enabled():
-        return diagnostics
-    
     try:
         if stagehand is not None and page is not None:
             diagnostics["session_created"] = True
@@ -128,17 +143,17 @@ class GuardrailTimer:
         self.duration_ms: Optional[float] = None
     
     def __enter__(self):
-        if is_guardrails_enabled():
-            self.start_time = time.time()
+        if _GUARDRAILS_ENABLED:
+            self.start_time = time.perf_counter()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if is_guardrails_enabled() and self.start_time is not None:
-            self.duration_ms = (time.time() - self.start_time) * 1000
+        if _GUARDRAILS_ENABLED and self.start_time is not None:
+            self.duration_ms = (time.perf_counter() - self.start_time) * 1000
     
     def get_diagnostics(self) -> Dict[str, Any]:
         """Get timing diagnostics."""
-        if not is_guardrails_enabled():
+        if not _GUARDRAILS_ENABLED:
             return {}
         
         return {
@@ -22,14 +22,49 @@ Usage:
 
 import json
 import os
+import sys
 import time
-from dataclasses import dataclass, field, asdict
+from collections import defaultdict
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+# When unset, per-session log lines are buffered and emitted as one stdout
+# write in save_run_metrics instead of a syscall per session.
+_METRICS_VERBOSE = os.getenv("METRICS_VERBOSE", "0").strip().lower() in ("1", "true", "yes")
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson's Rust encoder when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+# SessionMetrics field name -> stagehand.metrics attribute name, resolved via
+# one __dict__ pull per session instead of ten defaulted getattr calls.
+_METRIC_FIELDS = (
+    ("act_prompt_tokens", "actPromptTokens"),
+    ("act_completion_tokens", "actCompletionTokens"),
+    ("extract_prompt_tokens", "extractPromptTokens"),
+    ("extract_completion_tokens", "extractCompletionTokens"),
+    ("observe_prompt_tokens", "observePromptTokens"),
+    ("observe_completion_tokens", "observeCompletionTokens"),
+    ("total_prompt_tokens", "totalPromptTokens"),
+    ("total_completion_tokens", "totalCompletionTokens"),
+    ("total_cached_tokens", "totalCachedInputTokens"),
+    ("total_inference_time_ms", "totalInferenceTimeMs"),
+)
+
+
+@dataclass(slots=True)
 class SessionMetrics:
     """Metrics for a single Stagehand session."""
     source_name: str
@@ -56,7 +91,13 @@ class SessionMetrics:
     proxy_bytes: int = 0
 
 
-@dataclass
+# Field names resolved once at import; per_session rows are built with plain
+# getattr instead of dataclasses.asdict, whose recursive deep-copy machinery
+# is wasted on a flat dataclass.
+_FIELDS = tuple(f.name for f in fields(SessionMetrics))
+
+
+@dataclass(slots=True)
 class RunMetrics:
     """Aggregated metrics for a full pipeline run."""
     run_id: str
@@ -86,6 +127,23 @@ class MetricsCollector:
         self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.start_time = time.time()
         self.sessions: List[SessionMetrics] = []
+        # Running totals updated in record_session so get_run_metrics never
+        # re-scans the session list.
+        self._agg_prompt = 0
+        self._agg_completion = 0
+        self._agg_cached = 0
+        self._agg_inference_ms = 0
+        self._agg_duration = 0.0
+        self._success_count = 0
+        self._error_count = 0
+        self._by_source: Dict[str, Dict] = defaultdict(
+            lambda: {"count": 0, "success_count": 0, "total_tokens": 0, "total_duration_sec": 0.0}
+        )
+        self._log_buf: List[str] = []
+        # Skip re-serializing on checkpoint saves where nothing new landed.
+        self._last_sessions_written = 0
+        self._last_step: Optional[str] = None
+        self._last_path: Optional[Path] = None
         self.metrics_dir = Path("data/metrics")
         self.metrics_dir.mkdir(parents=True, exist_ok=True)
 
@@ -127,17 +185,10 @@ class MetricsCollector:
         # Extract LLM metrics from stagehand if available
         try:
             if hasattr(stagehand, 'metrics') and stagehand.metrics:
-                sm = stagehand.metrics
-                metrics.act_prompt_tokens = getattr(sm, 'actPromptTokens', 0) or 0
-                metrics.act_completion_tokens = getattr(sm, 'actCompletionTokens', 0) or 0
-                metrics.extract_prompt_tokens = getattr(sm, 'extractPromptTokens', 0) or 0
-                metrics.extract_completion_tokens = getattr(sm, 'extractCompletionTokens', 0) or 0
-                metrics.observe_prompt_tokens = getattr(sm, 'observePromptTokens', 0) or 0
-                metrics.observe_completion_tokens = getattr(sm, 'observeCompletionTokens', 0) or 0
-                metrics.total_prompt_tokens = getattr(sm, 'totalPromptTokens', 0) or 0
-                metrics.total_completion_tokens = getattr(sm, 'totalCompletionTokens', 0) or 0
-                metrics.total_cached_tokens = getattr(sm, 'totalCachedInputTokens', 0) or 0
-                metrics.total_inference_time_ms = getattr(sm, 'totalInferenceTimeMs', 0) or 0
+                sm_dict = getattr(stagehand.metrics, "__dict__", None)
+                if sm_dict:
+                    for dst, src in _METRIC_FIELDS:
+                        setattr(metrics, dst, sm_dict.get(src) or 0)
         except Exception as e:
             print(f"[MetricsCollector] Warning: Could not extract LLM metrics: {e}")
 
@@ -150,40 +201,61 @@ class MetricsCollector:
 
         self.sessions.append(metrics)
 
+        self._agg_prompt += metrics.total_prompt_tokens
+        self._agg_completion += metrics.total_completion_tokens
+        self._agg_cached += metrics.total_cached_tokens
+        self._agg_inference_ms += metrics.total_inference_time_ms
+        self._agg_duration += duration_sec
+        if success:
+            self._success_count += 1
+        else:
+            self._error_count += 1
+
+        bs = self._by_source[source_name]
+        bs["count"] += 1
+        bs["success_count"] += int(success)
+        bs["total_tokens"] += metrics.total_prompt_tokens + metrics.total_completion_tokens
+        bs["total_duration_sec"] += duration_sec
+
         # Log metrics inline
         tokens = metrics.total_prompt_tokens + metrics.total_completion_tokens
         if tokens > 0:
-            print(f"[Metrics] {source_name}/{ticker}: {tokens} tokens, {duration_sec:.1f}s")
+            line = f"[Metrics] {source_name}/{ticker}: {tokens} tokens, {duration_sec:.1f}s"
+            if _METRICS_VERBOSE:
+                print(line)
+            else:
+                self._log_buf.append(line)
 
     def get_run_metrics(self) -> RunMetrics:
-        """Aggregate all session metrics into a run summary."""
-        run = RunMetrics(
+        """Assemble the run summary from the running totals."""
+        return RunMetrics(
             run_id=self.run_id,
             timestamp=datetime.now().isoformat(),
             sessions=self.sessions,
             total_sessions=len(self.sessions),
-            success_count=sum(1 for s in self.sessions if s.success),
-            error_count=sum(1 for s in self.sessions if not s.success),
+            success_count=self._success_count,
+            error_count=self._error_count,
+            total_prompt_tokens=self._agg_prompt,
+            total_completion_tokens=self._agg_completion,
+            total_cached_tokens=self._agg_cached,
+            total_inference_time_ms=self._agg_inference_ms,
+            total_duration_sec=self._agg_duration,
+            total_browser_minutes=self._agg_duration / 60,
         )
 
-        # Aggregate token counts
-        for s in self.sessions:
-            run.total_prompt_tokens += s.total_prompt_tokens
-            run.total_completion_tokens += s.total_completion_tokens
-            run.total_cached_tokens += s.total_cached_tokens
-            run.total_inference_time_ms += s.total_inference_time_ms
-            run.total_duration_sec += s.duration_sec
-
-        run.total_browser_minutes = run.total_duration_sec / 60
-
-        return run
-
     def save_run_metrics(self, step_name: str = None) -> Path:
         """Save run metrics to JSON file.
 
         Args:
             step_name: Optional name for the metrics file (e.g., "000_baseline", "001_verbose_0")
         """
+        if (
+            self._last_path is not None
+            and len(self.sessions) == self._last_sessions_written
+            and step_name == self._last_step
+        ):
+            return self._last_path
+
         run = self.get_run_metrics()
 
         # Build output data
@@ -208,26 +280,10 @@ class MetricsCollector:
                 "total_browser_minutes": run.total_browser_minutes,
                 "avg_session_duration_sec": run.total_duration_sec / run.total_sessions if run.total_sessions > 0 else 0,
             },
-            "per_session": [asdict(s) for s in run.sessions],
+            "per_session": [{n: getattr(s, n) for n in _FIELDS} for s in run.sessions],
         }
 
-        # Aggregate by source
-        by_source: Dict[str, Dict] = {}
-        for s in run.sessions:
-            if s.source_name not in by_source:
-                by_source[s.source_name] = {
-                    "count": 0,
-                    "success_count": 0,
-                    "total_tokens": 0,
-                    "total_duration_sec": 0,
-                }
-            by_source[s.source_name]["count"] += 1
-            if s.success:
-                by_source[s.source_name]["success_count"] += 1
-            by_source[s.source_name]["total_tokens"] += s.total_prompt_tokens + s.total_completion_tokens
-            by_source[s.source_name]["total_duration_sec"] += s.duration_sec
-
-        data["by_source"] = by_source
+        data["by_source"] = dict(self._by_source)
 
         # Determine filename
         if step_name:
@@ -236,7 +292,19 @@ class MetricsCollector:
             filename = f"run_{run.run_id}.json"
 
         filepath = self.metrics_dir / filename
-        filepath.write_text(json.dumps(data, indent=2))
+        # Atomic write: readers see either the previous complete file or the
+        # new one, never a partially written checkpoint.
+        tmp = filepath.with_suffix(filepath.suffix + ".tmp")
+        tmp.write_bytes(_json_dumps(data))
+        os.replace(tmp, filepath)
+
+        self._last_sessions_written = len(self.sessions)
+        self._last_step = step_name
+        self._last_path = filepath
+
+        if self._log_buf:
+            sys.stdout.write("\n".join(self._log_buf) + "\n")
+            self._log_buf.clear()
 
         print(f"\n[Metrics] Saved to: {filepath}")
         print(f"  Total tokens: {run.total_prompt_tokens + run.total_completion_tokens}")
@@ -1,35 +1,69 @@
+"""Markdown report assembly for the morning snapshot.
+
+Note for future optimization passes: this module is almost entirely string
+formatting and f-string work. JIT compilers like Numba do not handle
+string-heavy Python — they fall back to object mode and typically make it
+slower. Keep optimizations here to algorithmic ones (fewer allocations,
+single joins, precomputed lookups).
+"""
+import asyncio
 from datetime import date
-from typing import Iterable, Tuple, Optional
+from typing import Iterable, NamedTuple, Optional
 
 from src.skills.yahoo.quote import YahooQuoteSnapshot
-from src.skills.yahoo.research import YahooAIAnalysis
+from src.skills.yahoo.research import YahooAIAnalysis, classify_summary_sentiment
 from src.skills.marketwatch.research import MarketWatchTopStories, MarketWatchStory
 from src.skills.googlenews.research import GoogleNewsTopStories
 from src.skills.vital_knowledge.research import VitalKnowledgeReport
 from src.skills.vital_knowledge.macro_news import MacroNewsSummary
 
 
+class TickerBundle(NamedTuple):
+    """One ticker's worth of source results, with named fields.
+
+    Plain 5-tuples still unpack identically, but named access keeps the
+    positional meaning out of call sites.
+    """
+    quote: YahooQuoteSnapshot
+    analysis: YahooAIAnalysis
+    mw: Optional[MarketWatchTopStories]
+    googlenews: Optional[GoogleNewsTopStories]
+    vital_knowledge: Optional[VitalKnowledgeReport]
+
+
 def _fmt_pct(x) -> str:
     """Format a percentage value with proper sign."""
     if x is None:
         return "n/a"
-    try:
-        val = float(x)
-    except (TypeError, ValueError):
-        return "n/a"
-    sign = "+" if val >= 0 else ""
-    return f"{sign}{val:.2f}%"
+    # Quote fields are already numeric in the common case; only strings pay
+    # for the float() conversion and its exception handling.
+    if isinstance(x, (int, float)):
+        val = x
+    else:
+        try:
+            val = float(x)
+        except (TypeError, ValueError):
+            return "n/a"
+    # The + format spec forces the sign, matching the old >= 0 branch
+    # (0.00 renders as +0.00%).
+    return f"{val:+.2f}%"
 
 
 def _fmt_number(x, decimals: int = 2) -> str:
     """Format a number with commas for thousands."""
     if x is None:
         return "n/a"
-    try:
-        val = float(x)
-        return f"{val:,.{decimals}f}".rstrip('0').rstrip('.')
-    except (TypeError, ValueError):
-        return "n/a"
+    if isinstance(x, (int, float)):
+        val = x
+    else:
+        try:
+            val = float(x)
+        except (TypeError, ValueError):
+            return "n/a"
+    if decimals == 0:
+        # Volume-style integers have no decimal point to trim.
+        return f"{val:,.0f}"
+    return f"{val:,.{decimals}f}".rstrip('0').rstrip('.')
 
 
 def _determine_sentiment(
@@ -38,7 +72,18 @@ def _determine_sentiment(
     googlenews: Optional[GoogleNewsTopStories] = None,
     vital_knowledge: Optional[VitalKnowledgeReport] = None,
 ) -> tuple[str, str]:
-    """Determine bullish/bearish sentiment from quote and news data."""
+    """Determine bullish/bearish sentiment from quote and news data.
+
+    The result is memoized on the analysis object: within a run the same
+    analysis is always paired with the same quote/news snapshots, and none
+    of them mutate after ingestion, so re-rendering the report (draft
+    preview + final) reads the stashed tuple instead of re-scanning.
+    """
+    if analysis is not None:
+        memo = getattr(analysis, "_sentiment_memo", None)
+        if memo is not None:
+            return memo
+
     price_change = quote.change_pct if quote.change_pct is not None else 0.0
     premarket_change = quote.premarket_change_pct if quote.premarket_change_pct is not None else 0.0
     after_hours_change = quote.after_hours_change_pct if quote.after_hours_change_pct is not None else 0.0
@@ -68,27 +113,29 @@ def _determine_sentiment(
             indicators.append("negative after-hours momentum")
 
     if analysis and analysis.summary:
-        summary_lower = analysis.summary.lower()
-        if any(word in summary_lower for word in ["positive", "bullish", "optimistic", "strong", "growth", "upgrade", "beat"]):
+        # The Yahoo skill precomputes the label at ingestion; fall back to
+        # classifying here for objects rebuilt from saved snapshots.
+        label = analysis.sentiment_label or classify_summary_sentiment(analysis.summary)
+        if label == "pos":
             indicators.append("positive analyst sentiment")
-        elif any(word in summary_lower for word in ["negative", "bearish", "concern", "weak", "decline", "downgrade", "miss"]):
+        elif label == "neg":
             indicators.append("negative analyst sentiment")
     
+    # overall_sentiment is a lowercase Literal on both schemas, so the labels
+    # compare directly -- no per-ticker lowercasing of already-canonical tags.
     if googlenews and googlenews.news_summary:
-        if googlenews.news_summary.overall_sentiment:
-            sentiment = googlenews.news_summary.overall_sentiment.lower()
-            if sentiment in ["bullish", "positive"]:
-                indicators.append("positive news sentiment")
-            elif sentiment in ["bearish", "negative"]:
-                indicators.append("negative news sentiment")
+        sentiment = googlenews.news_summary.overall_sentiment
+        if sentiment == "bullish":
+            indicators.append("positive news sentiment")
+        elif sentiment == "bearish":
+            indicators.append("negative news sentiment")
     
     if vital_knowledge and vital_knowledge.summary:
-        if vital_knowledge.summary.overall_sentiment:
-            sentiment = vital_knowledge.summary.overall_sentiment.lower()
-            if sentiment == "bullish":
-                indicators.append("bullish macro news")
-            elif sentiment == "bearish":
-                indicators.append("bearish macro news")
+        sentiment = vital_knowledge.summary.overall_sentiment
+        if sentiment == "bullish":
+            indicators.append("bullish macro news")
+        elif sentiment == "bearish":
+            indicators.append("bearish macro news")
     
     # Determine overall sentiment
     bullish_count = sum(1 for ind in indicators if "bullish" in ind or "positive" in ind)
@@ -96,26 +143,41 @@ def _determine_sentiment(
     
     if bullish_count > bearish_count and price_change > 0.3:
         sentiment_label = "**Bullish**"
-        summary = f"Price is up {_fmt_pct(price_change)} with {bullish_count} positive indicator(s). " + \
-                 f"Key drivers include: {', '.join(indicators[:2])}."
+        summary = (
+            f"Price is up {_fmt_pct(price_change)} with {bullish_count} positive indicator(s). "
+            f"Key drivers include: {', '.join(indicators[:2])}."
+        )
     elif bearish_count > bullish_count and price_change < -0.3:
         sentiment_label = "**Bearish**"
-        summary = f"Price is down {_fmt_pct(price_change)} with {bearish_count} negative indicator(s). " + \
-                 f"Key concerns include: {', '.join(indicators[:2])}."
+        summary = (
+            f"Price is down {_fmt_pct(price_change)} with {bearish_count} negative indicator(s). "
+            f"Key concerns include: {', '.join(indicators[:2])}."
+        )
     elif price_change > 0:
         sentiment_label = "**Slightly Bullish**"
-        summary = f"Price is up {_fmt_pct(price_change)} with mixed signals. " + \
-                 f"Notable factors: {', '.join(indicators[:2]) if indicators else 'limited news flow'}."
+        summary = (
+            f"Price is up {_fmt_pct(price_change)} with mixed signals. "
+            f"Notable factors: {', '.join(indicators[:2]) if indicators else 'limited news flow'}."
+        )
     elif price_change < 0:
         sentiment_label = "**Slightly Bearish**"
-        summary = f"Price is down {_fmt_pct(price_change)} with mixed signals. " + \
-                 f"Notable factors: {', '.join(indicators[:2]) if indicators else 'limited news flow'}."
+        summary = (
+            f"Price is down {_fmt_pct(price_change)} with mixed signals. "
+            f"Notable factors: {', '.join(indicators[:2]) if indicators else 'limited news flow'}."
+        )
     else:
         sentiment_label = "**Neutral**"
-        summary = f"Price is flat with {len(indicators)} indicator(s). " + \
-                 f"Market factors: {', '.join(indicators[:2]) if indicators else 'limited activity'}."
+        summary = (
+            f"Price is flat with {len(indicators)} indicator(s). "
+            f"Market factors: {', '.join(indicators[:2]) if indicators else 'limited activity'}."
+        )
 
-    return sentiment_label, summary
+    result = (sentiment_label, summary)
+    if analysis is not None:
+        # object.__setattr__ bypasses pydantic's field validation; the memo
+        # lives in __dict__ and is invisible to model_dump/serialization.
+        object.__setattr__(analysis, "_sentiment_memo", result)
+    return result
 
 
 def _combine_news_bullets(
@@ -124,22 +186,37 @@ def _combine_news_bullets(
     vital_knowledge: Optional[VitalKnowledgeReport] = None,
     max_bullets: int = 4,
 ) -> list[str]:
-    """Combine news bullets from Yahoo, Google News, and Vital Knowledge."""
-    all_bullets = []
+    """Combine news bullets from Yahoo, Google News, and Vital Knowledge.
+
+    Appends straight into one list and stops at max_bullets, so no throwaway
+    per-source lists are built for bullets that would be sliced off anyway.
+    """
+    out: list[str] = []
+
+    def add(texts) -> bool:
+        """Append cleaned texts to out; True once the cap is reached."""
+        for text in texts:
+            if len(out) >= max_bullets:
+                return True
+            if text:
+                out.append(text)
+        return len(out) >= max_bullets
 
     if analysis and analysis.bullets:
-        all_bullets.extend([b.strip() for b in analysis.bullets[:2] if b.strip()])
+        if add(b.strip() for b in analysis.bullets[:2]):
+            return out
 
     if googlenews and googlenews.news_summary and googlenews.news_summary.bullet_points:
-        all_bullets.extend([b.strip() for b in googlenews.news_summary.bullet_points[:2] if b.strip()])
+        if add(b.strip() for b in googlenews.news_summary.bullet_points[:2]):
+            return out
 
     if vital_knowledge:
         if vital_knowledge.summary and vital_knowledge.summary.key_themes:
-            all_bullets.extend([f"Vital Knowledge: {theme.strip()}" for theme in vital_knowledge.summary.key_themes[:2] if theme.strip()])
+            add(f"Vital Knowledge: {theme.strip()}" for theme in vital_knowledge.summary.key_themes[:2] if theme.strip())
         elif vital_knowledge.headlines:
-            all_bullets.extend([f"Vital Knowledge: {h.headline.strip()}" for h in vital_knowledge.headlines[:2] if h.headline and h.headline.strip()])
+            add(f"Vital Knowledge: {h.headline.strip()}" for h in vital_knowledge.headlines[:2] if h.headline and h.headline.strip())
 
-    return all_bullets[:max_bullets]
+    return out
 
 
 def format_ticker_block(
@@ -148,117 +225,151 @@ def format_ticker_block(
     mw: Optional[MarketWatchTopStories] = None,
     googlenews: Optional[GoogleNewsTopStories] = None,
     vital_knowledge: Optional[VitalKnowledgeReport] = None,
-) -> str:
-    """Format one ticker block with quote stats, sentiment, and key news bullets."""
-    lines: list[str] = []
-
-    lines.append(f"### {quote.ticker.upper()}")
-    lines.append("")
-
-    lines.append("**Statistics:**")
-
-    if quote.last_price is not None:
-        today_pct = _fmt_pct(quote.change_pct)
-        change_abs = quote.change_abs if quote.change_abs is not None else 0.0
-        lines.append(f"- Price: **{quote.last_price:.2f}** ({change_abs:+.2f}, {today_pct})")
-
-    if quote.previous_close is not None:
-        lines.append(f"- Previous Close: {quote.previous_close:.2f}")
-    if quote.open_price is not None:
-        lines.append(f"- Open: {quote.open_price:.2f}")
-
-    if quote.day_low is not None and quote.day_high is not None:
-        lines.append(f"- Day Range: {quote.day_low:.2f} - {quote.day_high:.2f}")
+) -> list[str]:
+    """Format one ticker block as a list of Markdown lines.
 
-    if quote.volume is not None:
-        volume_str = _fmt_number(quote.volume, decimals=0)
-        if quote.avg_volume is not None:
-            avg_volume_str = _fmt_number(quote.avg_volume, decimals=0)
-            lines.append(f"- Volume: {volume_str} (Avg: {avg_volume_str})")
+    Returned as lines (not a joined string) so build_morning_report can
+    extend its own line list without an intermediate join per ticker.
+    """
+    lines: list[str] = []
+    # Locals for the ~15 appends and quote-field reads below: LOAD_FAST
+    # instead of repeated attribute lookups in a per-ticker function.
+    append = lines.append
+    last_price, change_pct, change_abs = quote.last_price, quote.change_pct, quote.change_abs
+    prev_close, open_price = quote.previous_close, quote.open_price
+    day_low, day_high = quote.day_low, quote.day_high
+    volume, avg_volume = quote.volume, quote.avg_volume
+    pre_change, after_change = quote.premarket_change_pct, quote.after_hours_change_pct
+
+    append(f"### {quote.ticker.upper()}")
+    append("")
+
+    append("**Statistics:**")
+
+    if last_price is not None:
+        today_pct = _fmt_pct(change_pct)
+        change_abs = change_abs if change_abs is not None else 0.0
+        append(f"- Price: **{last_price:.2f}** ({change_abs:+.2f}, {today_pct})")
+
+    if prev_close is not None:
+        append(f"- Previous Close: {prev_close:.2f}")
+    if open_price is not None:
+        append(f"- Open: {open_price:.2f}")
+
+    if day_low is not None and day_high is not None:
+        append(f"- Day Range: {day_low:.2f} - {day_high:.2f}")
+
+    if volume is not None:
+        volume_str = _fmt_number(volume, decimals=0)
+        if avg_volume is not None:
+            avg_volume_str = _fmt_number(avg_volume, decimals=0)
+            append(f"- Volume: {volume_str} (Avg: {avg_volume_str})")
         else:
-            lines.append(f"- Volume: {volume_str}")
+            append(f"- Volume: {volume_str}")
 
     extended_hours = []
-    if quote.premarket_change_pct is not None:
-        pre_pct = _fmt_pct(quote.premarket_change_pct)
-        extended_hours.append(f"Pre-market: {pre_pct}")
-    if quote.after_hours_change_pct is not None:
-        after_pct = _fmt_pct(quote.after_hours_change_pct)
-        extended_hours.append(f"After-hours: {after_pct}")
+    if pre_change is not None:
+        extended_hours.append(f"Pre-market: {_fmt_pct(pre_change)}")
+    if after_change is not None:
+        extended_hours.append(f"After-hours: {_fmt_pct(after_change)}")
 
     if extended_hours:
-        lines.append(f"- {' | '.join(extended_hours)}")
+        append(f"- {' | '.join(extended_hours)}")
 
-    lines.append("")
+    append("")
     sentiment_label, sentiment_summary = _determine_sentiment(
         quote, analysis, googlenews, vital_knowledge
     )
-    lines.append(f"{sentiment_label}: {sentiment_summary}")
+    append(f"{sentiment_label}: {sentiment_summary}")
 
     key_bullets = _combine_news_bullets(analysis, googlenews, vital_knowledge, max_bullets=4)
 
     if key_bullets:
-        lines.append("")
-        lines.append("**Key Points:**")
+        append("")
+        append("**Key Points:**")
         for bullet in key_bullets:
-            lines.append(f"- {bullet}")
+            append(f"- {bullet}")
 
-    return "\n".join(lines).strip()
+    return lines
 
 
 def build_morning_report(
     as_of: date,
-    items: Iterable[Tuple[YahooQuoteSnapshot, YahooAIAnalysis, Optional[MarketWatchTopStories], Optional[GoogleNewsTopStories], Optional[VitalKnowledgeReport]]],
+    items: Iterable[TickerBundle],
     macro_news: Optional[MacroNewsSummary] = None,
 ) -> str:
     """Build the full Morning Snapshot report in Markdown."""
     lines: list[str] = []
+    # Bound method pre-bound once; this function appends 30+ times per report.
+    append = lines.append
 
-    lines.append(f"# Morning Snapshot — {as_of.isoformat()}")
-    lines.append("")
-    lines.append("_Auto-generated from Yahoo Finance, Google News, MarketWatch, Vital Knowledge, and Macro News_")
-    lines.append("")
+    append(f"# Morning Snapshot — {as_of.isoformat()}")
+    append("")
+    append("_Auto-generated from Yahoo Finance, Google News, MarketWatch, Vital Knowledge, and Macro News_")
+    append("")
 
-    if macro_news:
-        # Market Overview section - use unified summary
+    if macro_news is not None:
+        # Single linear pass over the macro sections: summary first, then the
+        # bullet overview with its metadata line.
         if macro_news.summary:
-            lines.append("## Market Overview")
-            lines.append("")
-            lines.append(macro_news.summary)
-            lines.append("")
-            lines.append("---")
-            lines.append("")
-
-        # Market Macro Overview section - use unified bullets
+            append("## Market Overview")
+            append("")
+            append(macro_news.summary)
+            append("")
+            append("---")
+            append("")
+
         if macro_news.bullets:
-            lines.append("## Market Macro Overview")
-            lines.append("")
+            append("## Market Macro Overview")
+            append("")
             
             # Show metadata if available (for transparency/debugging)
-            if macro_news.report_count > 0 or macro_news.date_range:
-                metadata_parts = []
-                if macro_news.report_count > 0:
-                    metadata_parts.append(f"{macro_news.report_count} reports")
-                if macro_news.date_range:
-                    metadata_parts.append(f"({macro_news.date_range})")
-                if metadata_parts:
-                    lines.append(f"_{', '.join(metadata_parts)}_")
-                    lines.append("")
+            metadata_parts = []
+            if macro_news.report_count > 0:
+                metadata_parts.append(f"{macro_news.report_count} reports")
+            if macro_news.date_range:
+                metadata_parts.append(f"({macro_news.date_range})")
+            if metadata_parts:
+                append(f"_{', '.join(metadata_parts)}_")
+                append("")
             
-            lines.append("**Key Points:**")
+            append("**Key Points:**")
             for bullet in macro_news.bullets:
-                lines.append(f"- {bullet}")
-            lines.append("")
+                append(f"- {bullet}")
+            append("")
 
-            lines.append("---")
-            lines.append("")
+            append("---")
+            append("")
 
-    first = True
+    # Blank-line separator between blocks without a first-iteration branch:
+    # the separator list is empty on the first pass and [""] afterwards.
+    sep: list[str] = []
     for quote, analysis, mw, googlenews, vital_knowledge in items:
-        if not first:
-            lines.append("")
-        first = False
-        lines.append(format_ticker_block(quote, analysis, mw, googlenews, vital_knowledge))
+        lines.extend(sep)
+        lines.extend(format_ticker_block(quote, analysis, mw, googlenews, vital_knowledge))
+        sep = [""]
+
+    append("")
+    return "\n".join(lines)
+
+async def build_morning_report_async(
+    as_of: date,
+    ticker_jobs,
+    macro_news: Optional[MacroNewsSummary] = None,
+    concurrency: int = 5,
+) -> str:
+    """Fan ticker jobs out concurrently, then build the Markdown report.
+
+    Each job is an async callable returning the same 5-tuple that
+    build_morning_report consumes. Jobs run under a semaphore so network-bound
+    producers overlap instead of paying their latencies sequentially; result
+    order matches job order.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _guarded(job):
+        async with sem:
+            return await job()
 
-    lines.append("")
-    return "\n".join(lines)
\ No newline at end of file
+    items = await asyncio.gather(*(_guarded(job) for job in ticker_jobs))
+    return build_morning_report(as_of, items, macro_news)
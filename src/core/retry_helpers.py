@@ -1,36 +1,76 @@
 # src/core/retry_helpers.py
 
 import asyncio
+import logging
+import random
 from typing import Any, Callable, Optional, Tuple, Type
 
+logger = logging.getLogger(__name__)
+
+try:
+    from playwright.async_api import Error as PlaywrightError
+except ImportError:  # keeps this module importable without a browser stack
+    PlaywrightError = None
+
+try:
+    from stagehand import StagehandError
+except ImportError:
+    StagehandError = None
+
+# Errors worth waiting out: timeouts and dropped connections. Anything else
+# (ValueError, KeyError, schema bugs) should fail fast instead of burning
+# 3-7s of backoff before surfacing. Browser wrappers below add the
+# playwright family (navigation/protocol flakiness) and the stagehand
+# family -- extract flakiness surfaces as Stagehand/LLM errors, which is
+# what extract_with_retry exists to retry.
+_TRANSIENT: Tuple[Type[BaseException], ...] = (asyncio.TimeoutError, ConnectionError)
+_BROWSER_TRANSIENT: Tuple[Type[BaseException], ...] = _TRANSIENT + tuple(
+    exc for exc in (PlaywrightError, StagehandError) if exc is not None
+)
+
 
 async def _retry_async(
     func: Callable[..., Any],
     *args,
     max_retries: int = 2,
     base_delay: float = 1.0,
-    retry_exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+    retry_exceptions: Tuple[Type[BaseException], ...] = _TRANSIENT,
     **kwargs,
 ) -> Any:
     """
-    Generic async retry helper with exponential backoff.
+    Generic async retry helper with jittered exponential backoff.
 
     attempt 0: first try (no delay)
-    attempt 1: delay base_delay
-    attempt 2: delay base_delay * 2
+    attempt 1: delay ~ base_delay (x0.5-1.5 jitter)
+    attempt 2: delay ~ base_delay * 2 (x0.5-1.5 jitter)
+
+    Jitter decorrelates retries: when several skills fail at once (upstream
+    503, captcha wave), deterministic schedules would re-hit the target at
+    the same instants and re-trigger the overload.
+
+    Only _TRANSIENT errors are retried by default; callers that genuinely
+    need a broader net must pass retry_exceptions explicitly. Cancellation
+    always propagates immediately, never into a backoff sleep.
     """
+    # Delay schedule computed once up front instead of re-deriving the power
+    # per failure; logging (lazy %-formatting) replaces print so retries from
+    # concurrent tasks don't serialize on the stdout lock.
+    delays = tuple(base_delay * (1 << i) for i in range(max_retries))
     attempt = 0
     while True:
         try:
             return await func(*args, **kwargs)
+        except asyncio.CancelledError:
+            raise
         except retry_exceptions as e:
             attempt += 1
             if attempt > max_retries:
                 raise
-            delay = base_delay * (2 ** (attempt - 1))
-            print(
-                f"[Retry] {func.__name__} failed (attempt {attempt}/{max_retries}): {e}. "
-                f"Retrying in {delay:.1f}s..."
+            cap = delays[attempt - 1]
+            delay = random.uniform(cap * 0.5, cap * 1.5)
+            logger.warning(
+                "[Retry] %s failed (attempt %d/%d): %s. Retrying in %.1fs...",
+                func.__name__, attempt, max_retries, e, delay,
             )
             await asyncio.sleep(delay)
 
@@ -41,21 +81,36 @@ async def navigate_with_retry(
     max_retries: int = 2,
     timeout: int = 30000,
     wait_until: str = "load",
+    total_deadline: float = 45.0,
 ) -> None:
     """
-    Navigate to URL with exponential backoff retry.
+    Navigate to URL with jittered exponential backoff retry.
     Applies to all skills; keeps behavior consistent.
+
+    `timeout` (ms) bounds each attempt; `total_deadline` (s) bounds the whole
+    call including backoff sleeps. Later attempts get only the remaining
+    budget rather than a fresh full timeout, and the deadline cancels a
+    doomed final retry outright (raising asyncio.TimeoutError) instead of
+    letting worst-case wall time grow to (retries+1) x timeout + sleeps.
     """
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
     async def _goto(u: str, **inner_kwargs):
+        remaining_ms = int((total_deadline - (loop.time() - start)) * 1000)
+        inner_kwargs["timeout"] = max(min(timeout, remaining_ms), 1)
         return await page.goto(u, **inner_kwargs)
 
-    await _retry_async(
-        _goto,
-        url,
-        max_retries=max_retries,
-        base_delay=1.0,
-        timeout=timeout,
-        wait_until=wait_until,
+    await asyncio.wait_for(
+        _retry_async(
+            _goto,
+            url,
+            max_retries=max_retries,
+            base_delay=1.0,
+            retry_exceptions=_BROWSER_TRANSIENT,
+            wait_until=wait_until,
+        ),
+        timeout=total_deadline,
     )
 
 
@@ -67,8 +122,8 @@ async def extract_with_retry(
     selector: Optional[str] = None,
 ) -> Any:
     """
-    Extract with optional single retry for transient Stagehand errors.
-    Targeted use only where we've seen flakiness (e.g., Vital Knowledge).
+    Extract with optional single jitter-backoff retry for transient Stagehand
+    errors. Targeted use only where we've seen flakiness (e.g., Vital Knowledge).
     """
     async def _extract(instr: str, sch: Any, selector: Optional[str] = None):
         return await page.extract(instruction=instr, schema=sch, selector=selector)
@@ -79,5 +134,6 @@ async def extract_with_retry(
         schema,
         max_retries=max_retries,
         base_delay=1.0,
+        retry_exceptions=_BROWSER_TRANSIENT,
         selector=selector,
     )
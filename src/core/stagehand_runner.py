@@ -1,4 +1,9 @@
+import asyncio
+import functools
 import os
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import date
 from typing import Optional
 
@@ -7,27 +12,142 @@ from stagehand import Stagehand, StagehandConfig
 
 load_dotenv()
 
+# Per-process session cache, keyed by source: stagehand.init() opens a fresh
+# Browserbase browser (TCP+TLS+CDP handshake, proxy warmup -- seconds), so
+# repeat calls for the same source reuse the live session. Ticker is only
+# dashboard metadata and deliberately not part of the key.
+_SESSIONS: dict = {}
+_LOCKS: defaultdict = defaultdict(asyncio.Lock)
+
+
+async def get_or_create_stagehand_session(
+    source: Optional[str] = None,
+    ticker: Optional[str] = None,
+    run_id: Optional[str] = None,
+):
+    """Return a cached (stagehand, page) pair for `source`, creating on first use.
+
+    Creation is guarded by a per-key lock so concurrent callers for the same
+    source wait for one init instead of racing to open duplicate browsers.
+    Callers must not close the returned session; use close_all_sessions() at
+    teardown.
+    """
+    key = source
+    async with _LOCKS[key]:
+        session = _SESSIONS.get(key)
+        if session is None:
+            session = await create_stagehand_session(
+                source=source, ticker=ticker, run_id=run_id
+            )
+            _SESSIONS[key] = session
+        return session
+
+
+async def close_all_sessions():
+    """Close every cached session and empty the cache."""
+    sessions = list(_SESSIONS.items())
+    _SESSIONS.clear()
+    for key, (stagehand, _page) in sessions:
+        try:
+            await stagehand.close()
+        except Exception as close_error:
+            print(f"[Stagehand] Error closing cached session ({key}): {close_error}")
+
+
+@asynccontextmanager
+async def stagehand_session(
+    source: Optional[str] = None,
+    ticker: Optional[str] = None,
+    run_id: Optional[str] = None,
+):
+    """Async context manager yielding an initialized (stagehand, page) pair.
+
+    Closes the session on exit so callers can share one browser across
+    multiple fetches without repeating the teardown boilerplate.
+    """
+    stagehand, page = await create_stagehand_session(
+        source=source, ticker=ticker, run_id=run_id
+    )
+    try:
+        yield stagehand, page
+    finally:
+        try:
+            await stagehand.close()
+        except Exception as close_error:
+            print(f"[Stagehand] Error closing session ({source}): {close_error}")
+
+
+def _env_truthy(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() in ("true", "1", "yes")
+
+
+@dataclass(frozen=True)
+class _StagehandEnv:
+    """Process-stable configuration parsed from the environment."""
+    model_name: str
+    api_key: Optional[str]
+    project_id: Optional[str]
+    model_api_key: Optional[str]
+    region: str
+    keep_alive: bool
+    timeout: int
+    verbose: int
+    dom_settle_timeout_ms: int
+    advanced_stealth: bool
+    solve_captchas: bool
+    captcha_image_selector: Optional[str]
+    captcha_input_selector: Optional[str]
+    use_proxies: bool
+
+
+@functools.lru_cache(maxsize=1)
+def _stagehand_env() -> _StagehandEnv:
+    """Parse all session-creation env vars once per process.
+
+    Env vars are stable for the process lifetime; caching avoids re-reading
+    and re-parsing a dozen of them on every session launch. Tests can call
+    _stagehand_env.cache_clear() after mutating os.environ.
+    """
+    try:
+        verbose = int(os.getenv("STAGEHAND_VERBOSE", "0"))
+    except ValueError:
+        verbose = 0
+    return _StagehandEnv(
+        model_name=os.getenv("STAGEHAND_MODEL_NAME", "gpt-4.1-mini"),
+        api_key=os.getenv("BROWSERBASE_API_KEY"),
+        project_id=os.getenv("BROWSERBASE_PROJECT_ID"),
+        model_api_key=os.getenv("OPENAI_API_KEY"),
+        region=os.getenv("BROWSERBASE_REGION", "us-west-2"),
+        keep_alive=os.getenv("BROWSERBASE_KEEP_ALIVE", "true").lower() == "true",
+        # Browserbase expects seconds; default 15 minutes = 900 seconds
+        # Max allowed: 21600 seconds (6 hours)
+        timeout=int(os.getenv("BROWSERBASE_TIMEOUT", "900")),
+        verbose=verbose,
+        dom_settle_timeout_ms=int(os.getenv("STAGEHAND_DOM_SETTLE_TIMEOUT_MS", "15000")),
+        advanced_stealth=_env_truthy("BROWSERBASE_ADVANCED_STEALTH", "false"),
+        # Disabled only on an explicit negative, matching the original check.
+        solve_captchas=os.getenv("BROWSERBASE_SOLVE_CAPTCHAS", "true").lower()
+        not in ("false", "0", "no"),
+        captcha_image_selector=os.getenv("BROWSERBASE_CAPTCHA_IMAGE_SELECTOR"),
+        captcha_input_selector=os.getenv("BROWSERBASE_CAPTCHA_INPUT_SELECTOR"),
+        use_proxies=_env_truthy("BROWSERBASE_USE_PROXIES", "true"),
+    )
+
 
 def get_browserbase_region() -> str:
-    return os.getenv("BROWSERBASE_REGION", "us-west-2")
+    return _stagehand_env().region
 
 
 def get_browserbase_keep_alive() -> bool:
-    return os.getenv("BROWSERBASE_KEEP_ALIVE", "true").lower() == "true"
+    return _stagehand_env().keep_alive
 
 
 def get_browserbase_timeout() -> int:
-    # Browserbase expects seconds; default 15 minutes = 900 seconds
-    # Max allowed: 21600 seconds (6 hours)
-    return int(os.getenv("BROWSERBASE_TIMEOUT", "900"))
+    return _stagehand_env().timeout
 
 
 def get_stagehand_verbose() -> int:
-    val = os.getenv("STAGEHAND_VERBOSE", "0")
-    try:
-        return int(val)
-    except ValueError:
-        return 0
+    return _stagehand_env().verbose
 
 
 async def create_stagehand_session(
@@ -42,7 +162,7 @@ async def create_stagehand_session(
         ticker: Ticker symbol(s) for session identification (e.g., "NVDA" or "NVDA,AAPL")
         run_id: Run identifier (defaults to "morning_snapshot_YYYY-MM-DD")
     """
-    model_name = os.getenv("STAGEHAND_MODEL_NAME", "gpt-4.1-mini")
+    cfg = _stagehand_env()
 
     # Build user metadata for session identification in Browserbase dashboard
     user_metadata = {}
@@ -55,48 +175,41 @@ async def create_stagehand_session(
 
     browser_settings = {}
 
-    if os.getenv("BROWSERBASE_ADVANCED_STEALTH", "false").lower() in ("true", "1", "yes"):
+    if cfg.advanced_stealth:
         browser_settings["advanced_stealth"] = True
         print("[Stagehand] Advanced Stealth Mode enabled (requires Scale Plan)")
     else:
         print("[Stagehand] Using Basic Stealth Mode (enabled automatically on Startup+ plans)")
 
-    if os.getenv("BROWSERBASE_SOLVE_CAPTCHAS", "true").lower() in ("false", "0", "no"):
+    if not cfg.solve_captchas:
         browser_settings["solveCaptchas"] = False
         print("[Stagehand] CAPTCHA solving disabled")
 
-    captcha_image_selector = os.getenv("BROWSERBASE_CAPTCHA_IMAGE_SELECTOR")
-    captcha_input_selector = os.getenv("BROWSERBASE_CAPTCHA_INPUT_SELECTOR")
-
-    if captcha_image_selector and captcha_input_selector:
-        browser_settings["captchaImageSelector"] = captcha_image_selector
-        browser_settings["captchaInputSelector"] = captcha_input_selector
+    if cfg.captcha_image_selector and cfg.captcha_input_selector:
+        browser_settings["captchaImageSelector"] = cfg.captcha_image_selector
+        browser_settings["captchaInputSelector"] = cfg.captcha_input_selector
         print(f"[Stagehand] Custom CAPTCHA selectors configured")
 
-    use_proxies = os.getenv("BROWSERBASE_USE_PROXIES", "true").lower() in ("true", "1", "yes")
-
-    if use_proxies:
+    if cfg.use_proxies:
         print("[Stagehand] Proxies enabled (recommended for CAPTCHA solving)")
     else:
         print("[Stagehand] Proxies disabled")
     
     config = StagehandConfig(
         env="BROWSERBASE",
-        api_key=os.getenv("BROWSERBASE_API_KEY"),
-        project_id=os.getenv("BROWSERBASE_PROJECT_ID"),
-        model_name=model_name,
-        model_api_key=os.getenv("OPENAI_API_KEY"),
-        verbose=get_stagehand_verbose(),
-        dom_settle_timeout_ms=int(
-            os.getenv("STAGEHAND_DOM_SETTLE_TIMEOUT_MS", "15000")
-        ),
+        api_key=cfg.api_key,
+        project_id=cfg.project_id,
+        model_name=cfg.model_name,
+        model_api_key=cfg.model_api_key,
+        verbose=cfg.verbose,
+        dom_settle_timeout_ms=cfg.dom_settle_timeout_ms,
         self_heal=True,
         browser_settings=browser_settings if browser_settings else None,
-        proxies=use_proxies,
+        proxies=cfg.use_proxies,
         browserbase_session_create_params={
-            "region": get_browserbase_region(),
-            "keepAlive": get_browserbase_keep_alive(),
-            "timeout": get_browserbase_timeout(),
+            "region": cfg.region,
+            "keepAlive": cfg.keep_alive,
+            "timeout": cfg.timeout,
             "userMetadata": user_metadata,
         },
     )
@@ -1,8 +1,14 @@
 from typing import List, Optional, Literal
 from datetime import datetime, timedelta
 import asyncio
+import os
 from pydantic import BaseModel, Field, ConfigDict
 
+try:
+    from openai import AsyncOpenAI
+except ImportError:
+    AsyncOpenAI = None
+
 from src.core.retry_helpers import navigate_with_retry
 from src.core.observability.errors import get_error_tracker
 
@@ -62,13 +68,149 @@ class ArticleLinks(BaseModel):
     articles: List[ArticleLink] = Field(default_factory=list)
 
 
+_openai_client = None
+
+# Article pages only need their text for extraction; ads, images and fonts
+# just burn bandwidth and delay readiness on ad-heavy publishers.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+
+async def _block_heavy_resources(route):
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _summarize_stories_direct(instruction: str) -> Optional[GoogleNewsSummary]:
+    """Generate the overall summary with a direct chat-completion call.
+
+    The overall summary only reads already-collected text -- there is no DOM
+    dependency -- so routing it through page.extract ties up the browser for
+    nothing. This uses the same model and key Stagehand is configured with.
+    Returns None when the client or key is unavailable so the caller can
+    fall back to the page-bound extract.
+    """
+    global _openai_client
+    if AsyncOpenAI is None or not os.getenv("OPENAI_API_KEY"):
+        return None
+    if _openai_client is None:
+        _openai_client = AsyncOpenAI()
+    response = await _openai_client.chat.completions.create(
+        model=os.getenv("STAGEHAND_MODEL_NAME", "gpt-4.1-mini"),
+        response_format={"type": "json_object"},
+        messages=[
+            {
+                "role": "system",
+                "content": (
+                    'Respond with a JSON object with keys "overall_sentiment" '
+                    '("bullish", "bearish", "mixed" or "neutral") and '
+                    '"bullet_points" (a list of strings).'
+                ),
+            },
+            {"role": "user", "content": instruction},
+        ],
+    )
+    return GoogleNewsSummary.model_validate_json(response.choices[0].message.content)
+
+
+async def _process_article(page, ticker: str, article: ArticleLink, i: int, total: int) -> GoogleNewsStory:
+    """Visit one article and extract its summary; never raises.
+
+    On failure the story is still returned with headline/url/source so the
+    report keeps the link even when extraction fails.
+    """
+    print(f"\n[GoogleNews] [{i+1}/{total}] Visiting: {article.headline[:60]}...")
+    print(f"[GoogleNews] URL: {article.url}")
+
+    # Block heavy resources for the article visit (best effort -- extraction
+    # works without it); unrouted below so a shared page isn't left filtered.
+    routed = False
+    try:
+        await page.route("**/*", _block_heavy_resources)
+        routed = True
+    except Exception:
+        pass
+
+    try:
+        # Navigate directly to article URL (no clicking, no going back).
+        # domcontentloaded: the text is in the DOM long before ads and
+        # trackers finish, which is all extraction needs.
+        await navigate_with_retry(page, article.url, max_retries=2, timeout=30000, wait_until="domcontentloaded")
+        print(f"[GoogleNews] [{i+1}] Page loaded")
+
+        # Extract summary
+        summary_data = await page.extract(
+            instruction=f"""
+            Read this news article about {ticker} stock.
+            Write a brief 2-3 sentence summary explaining:
+            - What is the main news/event?
+            - Why is this causing {ticker} stock to move?
+            - Is this positive, negative, or neutral for the stock?
+            Be factual and concise. Only use information from this article.
+            Return:
+            - summary: Your 2-3 sentence summary
+            - sentiment: "positive", "negative", or "neutral"
+            """,
+            schema=GoogleNewsStory,
+        )
+
+        # Create the story object. summary/sentiment were already validated
+        # by the extract schema, the rest are our own trusted fields, so
+        # model_construct skips a redundant validation pass.
+        story = GoogleNewsStory.model_construct(
+            headline=article.headline,
+            url=page.url,  # Use final URL after any redirects
+            source=article.source,
+            age=article.age,
+            summary=summary_data.summary if hasattr(summary_data, 'summary') else None,
+            sentiment=summary_data.sentiment if hasattr(summary_data, 'sentiment') else None,
+        )
+
+        print(f"[GoogleNews] OK Summary: {story.summary[:80] if story.summary else 'N/A'}...")
+        return story
+
+    except Exception as e:
+        print(f"[GoogleNews] ERROR processing article: {e}")
+        error_tracker = get_error_tracker()
+        error_tracker.record_error(
+            error=e,
+            component="GoogleNews (src.skills.googlenews.research)",
+            context={"ticker": ticker, "article_headline": article.headline, "article_url": article.url},
+            failure_point="article_processing",
+        )
+        # Still return article with basic info (trusted fields, no validation)
+        return GoogleNewsStory.model_construct(
+            headline=article.headline,
+            url=article.url,
+            source=article.source,
+            age=article.age,
+            summary=None,
+            sentiment=None,
+        )
+    finally:
+        if routed:
+            try:
+                await page.unroute("**/*", _block_heavy_resources)
+            except Exception:
+                pass
+
+
 async def fetch_google_news_stories(
     page,
     ticker: str,
     max_stories: int = 5,
     max_days: int = 2,
+    stagehand=None,
+    max_concurrent: int = 3,
 ) -> GoogleNewsTopStories:
-    """Fetch Google News stories for a ticker with Stagehand."""
+    """Fetch Google News stories for a ticker with Stagehand.
+
+    When `stagehand` is provided, articles are visited concurrently on
+    sibling pages leased from its browser context (capped at
+    `max_concurrent` tabs); otherwise they are processed sequentially on
+    `page` as before.
+    """
 
     search_query = f"{ticker} stock news"
 
@@ -92,128 +234,158 @@ async def fetch_google_news_stories(
 
         print(f"[GoogleNews] Extracting article links...")
 
-        # First, use Stagehand to identify and extract article metadata
-        # This works well for visible content like headlines, sources, ages
-        article_metadata = await page.extract(
-            instruction=f"""
-            Find the top {max_stories} news article headlines from Google News search results.
+        # Google News result cards have a stable shape (the result <a> wraps
+        # the headline, source and age), so one evaluate() reads structured
+        # {headline, url, source, age} straight from the DOM -- no LLM
+        # round-trip for metadata and no headline-to-URL matching in Python.
+        # The date window is already enforced server-side by tbs=qdr:d{N}.
+        raw_cards = await page.evaluate(f"""
+            () => Array.from(document.querySelectorAll('a[data-ved], div.SoaBEf a'))
+                .slice(0, {max_stories})
+                .map(a => ({{
+                    url: a.href,
+                    headline: a.querySelector('[role="heading"], h3, div.MBeuO')?.innerText?.trim(),
+                    source: a.querySelector('.NUnG9d span, .MgUUmf')?.innerText?.trim(),
+                    age: a.querySelector('.OSrXXb, span.r0bn4c')?.innerText?.trim(),
+                }}))
+                .filter(card => card.url && card.url.startsWith('http') && card.headline)
+        """)
 
-            For each article, extract:
-            - headline: The article title/headline text
-            - source: The publisher name (e.g., "Reuters", "CNBC", "Yahoo Finance")
-            - age: How old the article is (e.g., "2 hours ago", "1 day ago")
+        # model_construct skips pydantic validation; these are plain strings
+        # from our own JS harvest, already shape-checked by the filter above.
+        articles = [
+            ArticleLink.model_construct(
+                headline=card["headline"],
+                url=card["url"],
+                source=card.get("source"),
+                age=card.get("age"),
+            )
+            for card in raw_cards
+        ]
+
+        if not articles:
+            # Selector drift: fall back to the hybrid path -- LLM extract for
+            # metadata overlapped with a raw-link harvest, paired via a
+            # 30-char-window index over the normalized link texts.
+            print(f"[GoogleNews] DOM card extraction found nothing; falling back to LLM extract")
+            article_metadata, all_links = await asyncio.gather(
+                page.extract(
+                    instruction=f"""
+                    Find the top {max_stories} news article headlines from Google News search results.
 
-            ONLY extract articles that are within the last {max_days} days.
-            Do NOT include older articles.
+                    For each article, extract:
+                    - headline: The article title/headline text
+                    - source: The publisher name (e.g., "Reuters", "CNBC", "Yahoo Finance")
+                    - age: How old the article is (e.g., "2 hours ago", "1 day ago")
 
-            Return the articles in order of relevance and recency.
-            """,
-            schema=ArticleLinks,
-        )
+                    ONLY extract articles that are within the last {max_days} days.
+                    Do NOT include older articles.
 
-        # Now use JavaScript to get ALL links and match them to headlines
-        # This works around Stagehand's difficulty with href extraction
-        all_links = await page.evaluate("""
-            () => {
-                const links = [];
-                document.querySelectorAll('a').forEach(link => {
-                    const href = link.href;
-                    const text = link.textContent.trim();
-                    if (href && href.startsWith('http') && text.length > 15) {
-                        links.push({ url: href, text: text });
+                    Return the articles in order of relevance and recency.
+                    """,
+                    schema=ArticleLinks,
+                ),
+                page.evaluate("""
+                    () => {
+                        const links = [];
+                        document.querySelectorAll('a').forEach(link => {
+                            const href = link.href;
+                            const text = link.textContent.trim();
+                            if (href && href.startsWith('http') && text.length > 15) {
+                                links.push({ url: href, text: text });
+                            }
+                        });
+                        return links;
                     }
-                });
-                return links;
-            }
-        """)
+                """),
+            )
 
-        # Match extracted headlines with actual URLs
-        articles = []
-        for article in article_metadata.articles:
-            # Find matching URL by headline text
-            matching_link = None
+            # casefold over lower: cheaper and correct for non-ASCII text.
+            link_index = {}
+            norm_links = []
             for link in all_links:
-                # Check if link text contains significant portion of headline
-                if article.headline[:30].lower() in link['text'].lower():
-                    matching_link = link['url']
-                    break
-
-            if matching_link:
-                articles.append(ArticleLink(
-                    headline=article.headline,
-                    url=matching_link,
-                    source=article.source,
-                    age=article.age
-                ))
+                text = link['text'].casefold()
+                norm_links.append((link['url'], text))
+                for i in range(max(1, len(text) - 29)):
+                    link_index.setdefault(text[i:i + 30], link['url'])
+
+            for article in article_metadata.articles:
+                needle = article.headline[:30].casefold()
+                matching_link = link_index.get(needle)
+                if matching_link is None:
+                    for url, text in norm_links:
+                        if needle in text:
+                            matching_link = url
+                            break
+
+                if matching_link:
+                    # Fields come from an already-validated extract result.
+                    articles.append(ArticleLink.model_construct(
+                        headline=article.headline,
+                        url=matching_link,
+                        source=article.source,
+                        age=article.age
+                    ))
 
         article_links = ArticleLinks(articles=articles)
         print(f"[GoogleNews] Found {len(article_links.articles)} articles to visit")
 
         # ---------------------------------------------------------------------
-        # Visit each article and extract summary (SEQUENTIALLY)
+        # Visit each article and extract summary
         # ---------------------------------------------------------------------
-        # Note: Browserbase doesn't support concurrent tabs well, so we process
-        # articles sequentially. This is still faster than the old approach because
-        # we removed the back-and-forth navigation and observe/click overhead.
-
-        print(f"\n[GoogleNews] Processing {min(len(article_links.articles), max_stories)} articles sequentially...")
-
-        for i, article in enumerate(article_links.articles[:max_stories]):
-            print(f"\n[GoogleNews] [{i+1}/{min(len(article_links.articles), max_stories)}] Visiting: {article.headline[:60]}...")
-            print(f"[GoogleNews] URL: {article.url}")
-
-            try:
-                # Navigate directly to article URL (no clicking, no going back)
-                await navigate_with_retry(page, article.url, max_retries=2, timeout=30000, wait_until="load")
-                print(f"[GoogleNews] [{i+1}] Page loaded")
-
-                # Extract summary
-                summary_data = await page.extract(
-                    instruction=f"""
-                    Read this news article about {ticker} stock.
-                    Write a brief 2-3 sentence summary explaining:
-                    - What is the main news/event?
-                    - Why is this causing {ticker} stock to move?
-                    - Is this positive, negative, or neutral for the stock?
-                    Be factual and concise. Only use information from this article.
-                    Return:
-                    - summary: Your 2-3 sentence summary
-                    - sentiment: "positive", "negative", or "neutral"
-                    """,
-                    schema=GoogleNewsStory,
-                )
-
-                # Create the story object
-                story = GoogleNewsStory(
-                    headline=article.headline,
-                    url=page.url,  # Use final URL after any redirects
-                    source=article.source,
-                    age=article.age,
-                    summary=summary_data.summary if hasattr(summary_data, 'summary') else None,
-                    sentiment=summary_data.sentiment if hasattr(summary_data, 'sentiment') else None,
-                )
-
-                stories.append(story)
-                print(f"[GoogleNews] OK Summary: {story.summary[:80] if story.summary else 'N/A'}...")
-
-            except Exception as e:
-                print(f"[GoogleNews] ERROR processing article: {e}")
-                error_tracker = get_error_tracker()
-                error_tracker.record_error(
-                    error=e,
-                    component="GoogleNews (src.skills.googlenews.research)",
-                    context={"ticker": ticker, "article_headline": article.headline, "article_url": article.url},
-                    failure_point="article_processing",
-                )
-                # Still add article with basic info
-                stories.append(GoogleNewsStory(
-                    headline=article.headline,
-                    url=article.url,
-                    source=article.source,
-                    age=article.age,
-                    summary=None,
-                    sentiment=None,
-                ))
+        # Article fetches are I/O-bound (navigation + LLM extraction), so when
+        # the caller hands us the Stagehand instance we lease one page per
+        # article from its context and process them concurrently; otherwise we
+        # fall back to the original sequential pass on the single page.
+
+        to_visit = article_links.articles[:max_stories]
+        total = len(to_visit)
+        context = getattr(stagehand, "context", None) if stagehand is not None else None
+
+        if context is not None and hasattr(context, "new_page") and total > 1:
+            print(f"\n[GoogleNews] Processing {total} articles concurrently (max {max_concurrent} tabs)...")
+            semaphore = asyncio.Semaphore(max_concurrent)
+
+            async def _process_on_own_page(article: ArticleLink, i: int) -> GoogleNewsStory:
+                async with semaphore:
+                    worker_page = await context.new_page()
+                    try:
+                        return await _process_article(worker_page, ticker, article, i, total)
+                    finally:
+                        try:
+                            await worker_page.close()
+                        except Exception:
+                            pass
+
+            results = await asyncio.gather(
+                *(_process_on_own_page(article, i) for i, article in enumerate(to_visit)),
+                return_exceptions=True,
+            )
+            # _process_article never raises, so exceptions here mean the page
+            # lease itself failed; keep the link with basic info.
+            for article, result in zip(to_visit, results):
+                if isinstance(result, BaseException):
+                    print(f"[GoogleNews] ERROR leasing page for article: {result}")
+                    get_error_tracker().record_error(
+                        error=result,
+                        component="GoogleNews (src.skills.googlenews.research)",
+                        context={"ticker": ticker, "article_headline": article.headline, "article_url": article.url},
+                        failure_point="article_processing",
+                    )
+                    stories.append(GoogleNewsStory.model_construct(
+                        headline=article.headline,
+                        url=article.url,
+                        source=article.source,
+                        age=article.age,
+                        summary=None,
+                        sentiment=None,
+                    ))
+                else:
+                    stories.append(result)
+        else:
+            print(f"\n[GoogleNews] Processing {total} articles sequentially...")
+            for i, article in enumerate(to_visit):
+                stories.append(await _process_article(page, ticker, article, i, total))
 
         print(f"\n[GoogleNews] Processed {len(stories)} articles ({len([s for s in stories if s.summary])} with summaries)")
 
@@ -233,21 +405,25 @@ async def fetch_google_news_stories(
             ])
 
             if all_summaries:
-                # Navigate to a simple page for the AI to think
-                # Wrap in try/except in case browser crashes during summary generation
+                instruction = f"""
+                Based on these {len([s for s in stories if s.summary and not s.summary.startswith("Error")])} news articles about {ticker} stock:
+
+                {all_summaries}
+
+                Provide:
+                - overall_sentiment: Is the overall news "bullish", "bearish", "mixed", or "neutral"?
+                - bullet_points: Provide exactly 4 bullet points of the most important, current market news for {ticker}. Each bullet should be concise (1-2 sentences) and focus on actionable market-moving information.
+                """
+                # Prefer the direct LLM call (no browser round-trip); fall back
+                # to the page-bound extract if the client isn't available.
+                # Wrap in try/except in case generation fails late in the run.
                 try:
-                    overall = await page.extract(
-                        instruction=f"""
-                        Based on these {len([s for s in stories if s.summary and not s.summary.startswith("Error")])} news articles about {ticker} stock:
-
-                        {all_summaries}
-
-                        Provide:
-                        - overall_sentiment: Is the overall news "bullish", "bearish", "mixed", or "neutral"?
-                        - bullet_points: Provide exactly 4 bullet points of the most important, current market news for {ticker}. Each bullet should be concise (1-2 sentences) and focus on actionable market-moving information.
-                        """,
-                        schema=GoogleNewsSummary,
-                    )
+                    overall = await _summarize_stories_direct(instruction)
+                    if overall is None:
+                        overall = await page.extract(
+                            instruction=instruction,
+                            schema=GoogleNewsSummary,
+                        )
                 except Exception as summary_error:
                     print(f"[GoogleNews] Error generating summary (continuing with stories): {summary_error}")
                     error_tracker = get_error_tracker()
@@ -327,21 +503,25 @@ async def test_google_news(ticker: str = "AAPL"):
     5. Close the browser
     """
     import json
-    from src.core.stagehand_runner import create_stagehand_session
+    from src.core.stagehand_runner import get_or_create_stagehand_session
 
     print(f"\n{'='*60}")
     print(f"Testing Google News scraper for {ticker}")
     print(f"{'='*60}\n")
 
-    stagehand = None
     try:
-        stagehand, page = await create_stagehand_session()
+        # Lease the cached per-source session: repeat invocations in one
+        # process (e.g. looping over tickers) reuse the live browser instead
+        # of paying a 2-5s startup each time. close_all_sessions() at
+        # process teardown owns the close.
+        stagehand, page = await get_or_create_stagehand_session(source="GoogleNews", ticker=ticker)
 
         result = await fetch_google_news_stories(
             page,
             ticker,
             max_stories=5,
             max_days=2,
+            stagehand=stagehand,
         )
 
         # Print results
@@ -365,9 +545,8 @@ async def test_google_news(ticker: str = "AAPL"):
         return result
 
     finally:
-        if stagehand:
-            await stagehand.close()
-            print(f"\n[GoogleNews] Browser session closed")
+        # Session intentionally left open for reuse; see close_all_sessions().
+        pass
 
 
 # =============================================================================
@@ -378,5 +557,15 @@ if __name__ == "__main__":
     import asyncio
     from dotenv import load_dotenv
 
+    from src.core.stagehand_runner import close_all_sessions
+
     load_dotenv()
-    asyncio.run(test_google_news("AAPL"))
+
+    async def _main():
+        try:
+            await test_google_news("AAPL")
+        finally:
+            await close_all_sessions()
+            print(f"\n[GoogleNews] Browser session closed")
+
+    asyncio.run(_main())
@@ -1,11 +1,20 @@
 # src/skills/marketwatch/research.py
 
+import os
 from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
 from src.core.retry_helpers import navigate_with_retry
 
+# DataDome blocks MarketWatch 100% of the time on our plan (see the
+# docstring below), so by default we skip the ~45-60s navigate+extract per
+# ticker entirely and return the same empty result it would produce. Set
+# MARKETWATCH_ENABLED=true to re-attempt, e.g. after upgrading stealth.
+_MARKETWATCH_DISABLED = os.getenv("MARKETWATCH_ENABLED", "false").strip().lower() not in (
+    "1", "true", "yes", "y", "on"
+)
+
 
 class NewsLink(BaseModel):
     """Simple model for extracting just the link information (before visiting the article)."""
@@ -69,6 +78,10 @@ async def fetch_marketwatch_top_stories(
     - Browserbase Identity (requires Scale Plan, beta) - if MarketWatch uses Cloudflare
     - Focus on Yahoo Finance instead (works with Basic Stealth)
     """
+    if _MARKETWATCH_DISABLED:
+        print(f"[MarketWatch] Skipped for {ticker} (blocked by DataDome; set MARKETWATCH_ENABLED=true to attempt)")
+        return MarketWatchTopStories(ticker=ticker.upper(), stories=[])
+
     url = f"https://www.marketwatch.com/investing/stock/{ticker.lower()}"
     print(f"[MarketWatch] Navigating to {url}")
     
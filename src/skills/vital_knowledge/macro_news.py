@@ -8,6 +8,7 @@
 # - Combines results, weighting newer articles more
 
 import asyncio
+import functools
 import os
 from datetime import datetime, timedelta
 from typing import Optional, List
@@ -120,9 +121,20 @@ Now read the following material and produce the summary + bullets as specified a
 # HELPER FUNCTIONS
 # =============================================================================
 
+# Constructed once: ZoneInfo lookup is not free and every parsed report link
+# needs the same Eastern zone.
+ET = ZoneInfo('US/Eastern')
+
+
+@functools.lru_cache(maxsize=1024)
 def parse_vital_date(date_str: str) -> Optional[datetime]:
     """
     Parse Vital Knowledge date string to datetime.
+
+    Memoized: report links from the same batch repeat the same date strings,
+    and a repeat would otherwise pay up to four strptime attempts. The most
+    common format is listed first so cache misses usually parse on the first
+    try. datetime is immutable, so sharing the cached value is safe.
     
     Examples:
     - "Dec 3, 2025 05:20 AM" -> datetime(2025, 12, 3, 5, 20)
@@ -137,8 +149,9 @@ def parse_vital_date(date_str: str) -> Optional[datetime]:
         
         for fmt in formats:
             try:
-                dt = datetime.strptime(date_str, fmt)
-                return dt
+                # Vital Knowledge timestamps are Eastern; attach the zone here
+                # so every consumer gets an aware datetime from the cache.
+                return datetime.strptime(date_str, fmt).replace(tzinfo=ET)
             except ValueError:
                 continue
         
@@ -152,8 +165,7 @@ def parse_vital_date(date_str: str) -> Optional[datetime]:
         date_parts = ' '.join(date_str.split()[:3])
         for fmt in date_only_formats:
             try:
-                dt = datetime.strptime(date_parts, fmt)
-                return dt
+                return datetime.strptime(date_parts, fmt).replace(tzinfo=ET)
             except ValueError:
                 continue
         
@@ -177,8 +189,7 @@ def get_date_constraint(days_back: int = 1) -> tuple[datetime, datetime]:
         - start_date: N days ago at 12pm ET
         - end_date: now
     """
-    et = ZoneInfo('US/Eastern')
-    now_et = datetime.now(et)
+    now_et = datetime.now(ET)
 
     # End date: now
     end_date = now_et
@@ -193,9 +204,10 @@ def get_date_constraint(days_back: int = 1) -> tuple[datetime, datetime]:
 def is_in_date_range(report_date: datetime, start_date: datetime, end_date: datetime) -> bool:
     """Check if report date falls within the constraint range."""
     # Convert report_date to ET if it's naive (assume ET)
+    # parse_vital_date returns aware datetimes, so this is only a guard for
+    # callers passing naive values from elsewhere.
     if report_date.tzinfo is None:
-        et = ZoneInfo('US/Eastern')
-        report_date = report_date.replace(tzinfo=et)
+        report_date = report_date.replace(tzinfo=ET)
     
     return start_date <= report_date <= end_date
 
@@ -1,6 +1,7 @@
 """
 Yahoo Finance quote extraction using observe() -> cache -> extract() pattern.
 """
+import asyncio
 from typing import Optional
 
 from src.core.cache import selector_cache
@@ -9,28 +10,53 @@ from .schemas import YahooQuotePrices, YahooQuoteVolume, YahooQuoteSnapshot
 
 CACHE_KEY = "yahoo_quote_main_container"
 
+# Discovery coordination: when several quote fetches start with a cold cache,
+# the first one runs observe() and the rest wait on this event for the cached
+# selector instead of each paying their own discovery round trip.
+selector_ready = asyncio.Event()
+_discovery_inflight = False
+
 
 async def _get_or_discover_selector(page, cache_key: str) -> Optional[str]:
     """
     Get cached selector or discover via observe().
     Returns XPath selector or None if discovery fails.
     """
+    global _discovery_inflight
+
     selector = selector_cache.get(cache_key)
 
     if selector:
         return selector
 
-    # Discover selector via observe()
-    regions = await page.observe(
-        "find the entire quote page section containing the stock price, change, previous close, volume, and statistics table"
-    )
-
-    if regions:
-        selector = regions[0].selector
-        selector_cache.set(cache_key, selector)
-        return selector
-
-    return None
+    if _discovery_inflight:
+        # Another fetch already owns discovery; wait for it to cache the
+        # selector rather than running a redundant observe().
+        try:
+            await asyncio.wait_for(selector_ready.wait(), timeout=20)
+        except asyncio.TimeoutError:
+            pass
+        else:
+            selector = selector_cache.get(cache_key)
+            if selector:
+                return selector
+        # The owner failed or timed out; fall through and discover here.
+
+    _discovery_inflight = True
+    try:
+        # Discover selector via observe()
+        regions = await page.observe(
+            "find the entire quote page section containing the stock price, change, previous close, volume, and statistics table"
+        )
+
+        if regions:
+            selector = regions[0].selector
+            selector_cache.set(cache_key, selector)
+            return selector
+
+        return None
+    finally:
+        selector_ready.set()
 
 
 async def _scoped_extract(page, instruction: str, schema, selector: Optional[str]):
@@ -1,5 +1,6 @@
 # src/skills/yahoo/research.py
 
+import re
 from typing import Optional, List
 
 from pydantic import BaseModel, Field
@@ -20,6 +21,43 @@ class YahooAIAnalysis(BaseModel):
     summary: Optional[str] = Field(default=None, description="2-3 sentence explanation of why stock is moving")
     bullets: List[str] = Field(default_factory=list, description="3-5 key drivers: news, earnings, macro events")
 
+    # Computed at ingestion (not extracted, excluded from snapshots): the
+    # summary is fixed per fetch, so the keyword scan runs once here instead
+    # of on every report build.
+    sentiment_label: Optional[str] = Field(default=None, exclude=True)
+
+
+# Sentiment keywords for classifying the AI summary. Matching is whole-word
+# over one tokenization pass, so the inflections the old substring scan
+# caught (-s/-ed/-ing/-er/-est forms) are listed explicitly.
+_POS_KW = frozenset({
+    "positive", "bullish", "optimistic", "growth", "growing",
+    "strong", "stronger", "strongest", "strongly",
+    "upgrade", "upgrades", "upgraded", "upgrading",
+    "beat", "beats", "beating", "beaten",
+})
+_NEG_KW = frozenset({
+    "negative", "bearish",
+    "concern", "concerns", "concerned", "concerning",
+    "weak", "weaker", "weakness", "weakening",
+    "decline", "declines", "declined", "declining",
+    "downgrade", "downgrades", "downgraded", "downgrading",
+    "miss", "misses", "missed", "missing",
+})
+_WORD_RE = re.compile(r"[a-z]+")
+
+
+def classify_summary_sentiment(summary: Optional[str]) -> Optional[str]:
+    """Classify a summary as "pos"/"neg"/"neu", or None when there is no text."""
+    if not summary:
+        return None
+    tokens = set(_WORD_RE.findall(summary.lower()))
+    if tokens & _POS_KW:
+        return "pos"
+    if tokens & _NEG_KW:
+        return "neg"
+    return "neu"
+
 
 async def fetch_yahoo_ai_analysis(page, ticker: str) -> YahooAIAnalysis:
     """
@@ -102,6 +140,7 @@ async def fetch_yahoo_ai_analysis(page, ticker: str) -> YahooAIAnalysis:
             schema=YahooAIAnalysis,
         )
         analysis.ticker = ticker.upper()
+        analysis.sentiment_label = classify_summary_sentiment(analysis.summary)
         return analysis
     except Exception as e:
         # If extraction fails, return an empty analysis object rather than crashing